@@ -0,0 +1,116 @@
+"""
+Micro-benchmark of the compiled filter engine
+against the original, interpreted, validator.
+
+Run from the project root after installing the
+project into the environment:
+
+    python benchmarks/filters.py
+"""
+
+import timeit, uuid
+
+from scryer.util.filters import (
+    NOT_FOUND,
+    FilterStatement,
+    LogicalOp,
+    compile_statement
+)
+
+OBJECT_COUNT = 10_000
+REPEAT       = 5
+
+
+class Client:
+    """Stand in for a brokered socket connection."""
+
+    def __init__(self, session_uuid: uuid.UUID, role: str):
+        self.cookies = {"session_uuid": session_uuid, "role": role}
+
+
+def interpreted_validator(statement: FilterStatement):
+    """
+    The original `compose_validator`
+    implementation, kept here as a baseline.
+    """
+
+    logic   = LogicalOp.from_other(statement["logic"])
+    filters = statement["filters"]
+
+    if not filters:
+        return (lambda _: True)
+
+    def validator(obj: object) -> bool:
+        res = True
+
+        for f in filters:
+            op = LogicalOp.from_other(f["operator"])
+
+            field_parts = f["field"].split(".")
+            obj_value   = getattr(obj, field_parts[0])
+            for part in field_parts[1:]:
+
+                if isinstance(obj_value, dict):
+                    obj_value = obj_value.get(part, NOT_FOUND)
+                else:
+                    obj_value = getattr(obj_value, part, NOT_FOUND)
+
+                if obj_value is NOT_FOUND:
+                    return False
+
+            fil_value = f["value"]
+            res  = logic.do(res, op.do(fil_value, obj_value))
+
+        return res
+
+    return validator
+
+
+def statement_for(session_uuid: uuid.UUID) -> FilterStatement:
+    # Built fresh on every call, the same way
+    # sessions build their client filters on each
+    # broadcast.
+    return {
+        "logic": "and",
+        "filters": [
+            {
+                "field": "cookies.session_uuid",
+                "operator": "eq",
+                "value": session_uuid
+            },
+            {
+                "field": "cookies.role",
+                "operator": "eq",
+                "value": "player"
+            }
+        ]
+    }
+
+
+def main():
+    sessions = [uuid.uuid4() for _ in range(100)]
+    objects  = [
+        Client(sessions[i % len(sessions)], ("player", "observer")[i % 2])
+        for i in range(OBJECT_COUNT)
+    ]
+    target = sessions[0]
+
+    def run(factory):
+        isvalid = factory(statement_for(target))
+        return sum(1 for o in objects if isvalid(o))
+
+    assert run(interpreted_validator) == run(compile_statement)
+
+    results = {}
+    for name, factory in (
+            ("interpreted", interpreted_validator),
+            ("compiled", compile_statement)):
+        best = min(timeit.repeat(lambda: run(factory), number=1, repeat=REPEAT))
+        results[name] = best
+        print(f"{name:>12}: {best * 1000:8.2f}ms / {OBJECT_COUNT} objects")
+
+    print(f"{'speedup':>12}: {results['interpreted'] / results['compiled']:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
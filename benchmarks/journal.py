@@ -0,0 +1,88 @@
+"""
+Benchmark of restoring sessions by replaying the
+session journal.
+
+Run from the project root after installing the
+project into the environment:
+
+    python benchmarks/journal.py
+"""
+
+import asyncio, tempfile, time
+
+from scryer.creatures import CharacterV2
+from scryer.services import (
+    CombatSession,
+    EventMemoryBroker,
+    SessionJournal,
+    SessionSocket,
+    SocketMemoryBroker
+)
+from scryer.util import request_uuid
+from scryer.util.events import Event
+
+MUTATION_COUNT = 10_000
+SESSION_COUNT  = 10
+
+
+async def write_journal(journal: SessionJournal, clients, events):
+    sessions = [
+        CombatSession.new_instance(f"table {i}", clients, events)
+        for i in range(SESSION_COUNT)
+    ]
+    for session in sessions:
+        journal.attach(session)
+
+    # Characters are created, wounded, and killed
+    # off while turns pass around each table.
+    mutations = 0
+    while mutations < MUTATION_COUNT:
+        for session in sessions:
+            character = CharacterV2(
+                conditions=[],
+                creature_id=request_uuid(),
+                hit_points=(10, 10), #type: ignore
+                initiative=mutations % 20,
+                name=f"goblin {mutations}")
+            await session.characters.modify(character.creature_uuid, character)
+
+            character.hit_points = (4, 10) #type: ignore
+            await session.characters.modify(character.creature_uuid, character)
+            session.set_current_character(character.creature_uuid)
+            if mutations % 3 == 0:
+                await session.characters.delete(character.creature_uuid)
+            mutations += 4
+
+
+def main():
+    clients = SocketMemoryBroker(SessionSocket)
+    events  = EventMemoryBroker(Event)
+
+    with tempfile.TemporaryDirectory() as path:
+        # Never compact, so the whole history is
+        # replayed from the log.
+        journal = SessionJournal(path, snapshot_every=MUTATION_COUNT * 2)
+        journal.open()
+        asyncio.run(write_journal(journal, clients, events))
+        journal._log.close() #type: ignore
+
+        size = journal.log_path.stat().st_size
+        start = time.perf_counter()
+        restored = SessionJournal(path).restore(clients, events)
+        replay = time.perf_counter() - start
+
+        journal._log = journal.log_path.open("a")
+        journal.compact()
+        journal._log.close()
+        start = time.perf_counter()
+        SessionJournal(path).restore(clients, events)
+        snapshot = time.perf_counter() - start
+
+    characters = sum(len(s.characters.resource_map) for s in restored) #type: ignore
+    print(f"{'journal':>10}: {MUTATION_COUNT} mutations, {size / 1024:.0f}KiB")
+    print(f"{'replay':>10}: {replay * 1000:8.2f}ms ({len(restored)} sessions, {characters} characters)")
+    print(f"{'snapshot':>10}: {snapshot * 1000:8.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,7 @@ import { updateInitiativeTop } from '@/app/_apis/sessionApi'
 import { AddCharacterDialog } from './add-creature/add-character-dialog'
 import { WebsocketContext } from '../../common/websocket-context'
 import { EventType } from '@/app/_apis/eventType'
+import { OrderUpdate, applyOrderUpdate } from '@/app/_apis/orderUpdate'
 import { Box, Grid } from '@mui/material'
 import { SessionContext } from '@/app/common/session-context'
 
@@ -21,6 +22,7 @@ export const Container: FC<ContainerProps> = ({ }) => {
 	let sessionId = useContext(SessionContext);
 
 	const cardsRef = useRef<Character[]>([]);
+	const orderVersion = useRef<number | null>(null);
 
 	cardsRef.current = cards;
 
@@ -32,7 +34,13 @@ export const Container: FC<ContainerProps> = ({ }) => {
 		if (lastJsonMessage !== null) {
 			switch (lastJsonMessage.event_type) {
 				case EventType.ReceiveOrderUpdate: {
-					reloadList();
+					const update: OrderUpdate = lastJsonMessage.event_body;
+					const order = applyOrderUpdate(cardsRef.current, orderVersion.current, update);
+					orderVersion.current = update.version;
+					if (order === null)
+						reloadList();
+					else
+						setCards(order);
 					return;
 				}
 			}
@@ -9,6 +9,7 @@ import { useRouter } from "next/navigation";
 import useWebSocket, { ReadyState } from 'react-use-websocket';
 import { Character, CharacterType, EMPTY_GUID, FieldType, LogicType, OperatorType } from '@/app/_apis/character';
 import { EventType, SubscriptionEventType, WebsocketEvent } from '@/app/_apis/eventType';
+import { heartbeatOptions } from '@/app/_apis/heartbeat';
 import { PlayerInputList } from './player-input-list';
 import { RequestPlayerInput } from './request-player-input';
 import { deleteAllMonsters, getCharacters } from '@/app/_apis/characterApi';
@@ -34,7 +35,7 @@ const DmDashboardPage = ({ params }: { params: { sessionid: string } }) => {
 	const router = useRouter();
 
 	const { sendMessage, sendJsonMessage, readyState, lastMessage, lastJsonMessage } =
-		useWebSocket<WebsocketEvent>(`${process.env.NEXT_PUBLIC_WEBSOCKET_BASEURL}/sessions/${params.sessionid}/ws`);
+		useWebSocket<WebsocketEvent>(`${process.env.NEXT_PUBLIC_WEBSOCKET_BASEURL}/sessions/${params.sessionid}/ws`, heartbeatOptions);
 
 	function setInitialConditions(conditions: any[], updated: APIReference[]) {
 		return updated;
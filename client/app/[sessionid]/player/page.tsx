@@ -1,13 +1,15 @@
 'use client'
 
 import { addSessionInput, getSingleSession } from "@/app/_apis/sessionApi";
-import { useEffect, useState } from "react";
+import { useEffect, useRef, useState } from "react";
 import { getCharactersPlayer } from "@/app/_apis/characterApi";
 import { Character, CharacterType, EMPTY_GUID, HpBoundaryOptions, OBSERVER_NAME } from "@/app/_apis/character";
 import { Box, Grid } from "@mui/material";
 import useWebSocket from 'react-use-websocket';
 import { EventType, SubscriptionEventType, WebsocketEvent } from "@/app/_apis/eventType";
 import { RequestPlayerInput } from "@/app/_apis/playerInput";
+import { OrderUpdate, applyOrderUpdate } from "@/app/_apis/orderUpdate";
+import { heartbeatOptions } from "@/app/_apis/heartbeat";
 import { getAllConditions, getAllSkills } from "@/app/_apis/dnd5eApi";
 import { ConditionItem } from "./condition-item";
 import { SkillRequest } from "./skill-request";
@@ -32,11 +34,12 @@ export default function PlayerPage({ params }: { params: { sessionid: string } }
 	const [conditionOptions, setConditionOptions] = useState<APIReference[]>([]);
 	const [skills, setSkills] = useState<APIReference[]>([]);
 	const [alert, setAlert] = useState<AlertInfo | null>(null);
+	const orderVersion = useRef<number | null>(null);
 
 	const router = useRouter();
 
 	const { sendMessage, sendJsonMessage, readyState, lastJsonMessage } =
-		useWebSocket<WebsocketEvent>(`${process.env.NEXT_PUBLIC_WEBSOCKET_BASEURL}/sessions/${params.sessionid}/ws`);
+		useWebSocket<WebsocketEvent>(`${process.env.NEXT_PUBLIC_WEBSOCKET_BASEURL}/sessions/${params.sessionid}/ws`, heartbeatOptions);
 
 	useEffect(() => {
 		getLatestInitiativeOrder();
@@ -55,7 +58,13 @@ export default function PlayerPage({ params }: { params: { sessionid: string } }
 				case EventType.ReceiveOrderUpdate: {
 					setAlert({ type: 'info', message: 'Initiative order updates.' });
 
-					getLatestInitiativeOrder();
+					const update: OrderUpdate = lastJsonMessage.event_body;
+					const order = applyOrderUpdate(initiativeOrder, orderVersion.current, update);
+					orderVersion.current = update.version;
+					if (order === null)
+						getLatestInitiativeOrder();
+					else
+						setInitiativeOrder(order);
 					return;
 				}
 				case EventType.EndSession: {
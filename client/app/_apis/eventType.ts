@@ -5,11 +5,13 @@ export enum EventType{
     ReceiveOrderUpdate = 'receive_order_update',
     ReceiveClientId = 'receive_client_uuid',
     EndSession = 'end_session',
-    JoinSession = 'join_session'
+    JoinSession = 'join_session',
+    Ping = 'ping'
 }
 
 export enum SubscriptionEventType{
     JoinSession = 'join_session',
+    Pong = 'pong',
 }
 
 export interface WebsocketEvent { event_type: EventType, event_body: any }
\ No newline at end of file
@@ -0,0 +1,32 @@
+import { EventType, SubscriptionEventType, WebsocketEvent } from "./eventType";
+
+function parsePing(event: MessageEvent): WebsocketEvent | null {
+    if (typeof event.data !== 'string' || !event.data.includes(EventType.Ping)) {
+        return null;
+    }
+
+    const message: WebsocketEvent = JSON.parse(event.data);
+    return message.event_type === EventType.Ping ? message : null;
+}
+
+/**
+ * Options for `useWebSocket` which answer the
+ * server's heartbeat. Pings are answered as soon
+ * as they arrive and never replace
+ * `lastJsonMessage`, so they do not re-render
+ * the page.
+ */
+export const heartbeatOptions = {
+    filter: (event: MessageEvent) => parsePing(event) === null,
+    onMessage: (event: MessageEvent) => {
+        const ping = parsePing(event);
+        if (ping === null) {
+            return;
+        }
+
+        (event.target as WebSocket).send(JSON.stringify({
+            event_type: SubscriptionEventType.Pong,
+            event_body: ping.event_body
+        }));
+    }
+};
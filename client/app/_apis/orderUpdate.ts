@@ -0,0 +1,37 @@
+import { Character } from "./character";
+
+export interface OrderUpdate {
+    version: number,
+    base_version: number | null,
+    added: Character[],
+    changed: Character[],
+    removed: string[],
+    current: string | null
+}
+
+/**
+ * Apply an order update to the initiative order
+ * last seen at `version`. Returns null if the
+ * update does not follow on from that version,
+ * in which case the full order must be fetched.
+ */
+export function applyOrderUpdate(order: Character[], version: number | null, update: OrderUpdate): Character[] | null {
+    if (version === null || update.base_version !== version) {
+        return null;
+    }
+
+    const removed = new Set(update.removed);
+    const updated = new Map([...update.added, ...update.changed].map(c => [c.creature_id, c]));
+
+    const merged = order
+        .filter(c => !removed.has(c.creature_id))
+        .map(c => updated.get(c.creature_id) ?? c);
+    const known = new Set(merged.map(c => c.creature_id));
+    merged.push(...update.added.filter(c => !known.has(c.creature_id)));
+
+    // Sorting is stable, so ties keep their place.
+    merged.sort((a, b) => b.initiative - a.initiative);
+
+    const current = merged.findIndex(c => c.creature_id === update.current);
+    return current > 0 ? [...merged.slice(current), ...merged.slice(0, current)] : merged;
+}
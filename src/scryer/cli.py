@@ -4,9 +4,12 @@ our application as configured per our
 preferrences.
 """
 
+import asyncio
+import contextlib
 import pathlib
 import subprocess
 import sys
+import tempfile
 
 import click
 import uvicorn
@@ -55,10 +58,19 @@ def scryer_make_api(release: bool):
     pip(*args, ".")
 
 
-def scryer_start_api(hostname: str, port: int, workers: int):
+def scryer_start_api(
+        hostname: str,
+        port: int,
+        workers: int,
+        ws_deflate: bool = True):
     """Run the REST application."""
 
-    kwds = dict(factory=True, host=hostname, port=port, reload=True)
+    kwds = dict(
+        factory=True,
+        host=hostname,
+        port=port,
+        reload=True,
+        ws_per_message_deflate=ws_deflate)
     if workers:
         # Workers are ignored when 'reload' is
         # enabled. Might not want to implicitly
@@ -72,6 +84,33 @@ def scryer_start_api(hostname: str, port: int, workers: int):
     uvicorn.run(application_path(), **kwds) #type: ignore[arg-type]
 
 
+def scryer_start_sharded(
+        hostname: str,
+        port: int,
+        shards: int,
+        ws_deflate: bool = True):
+    """
+    Run the REST application as `shards` worker
+    processes behind a router which sends each
+    session to one worker.
+    """
+
+    from scryer.router import serve_sharded
+
+    argv = [python_path(), "-m", "uvicorn", "--factory", application_path()]
+    argv += ["--ws-per-message-deflate", str(ws_deflate)]
+    if (log_config := EXECUTION_ROOT.joinpath(LOG_CONFIG_NAME)).exists():
+        argv += ["--log-config", str(log_config)]
+
+    with contextlib.suppress(asyncio.CancelledError, KeyboardInterrupt):
+        asyncio.run(serve_sharded(
+            hostname,
+            port,
+            shards,
+            argv,
+            tempfile.gettempdir()))
+
+
 # -----------------------------------------------
 # Command Line Interface (CLI).
 # -----------------------------------------------
@@ -99,11 +138,36 @@ def make(*, release: bool):
 @click.option("-H", "--hostname", default="localhost")
 @click.option("-p", "--port", default=8000)
 @click.option("-W", "--workers", type=int, default=None)
-def start(hostname: str, port: int, *, workers: int | None):
+@click.option(
+    "-S",
+    "--shards",
+    type=int,
+    default=None,
+    help="Run sessions sharded across this many workers.")
+@click.option(
+    "--ws-deflate/--no-ws-deflate",
+    default=True,
+    help="Compress websocket messages when clients support it.")
+def start(
+        hostname: str,
+        port: int,
+        *,
+        workers: int | None,
+        shards: int | None,
+        ws_deflate: bool):
     """Starts the web server."""
 
     # TODO: implement startup for `client` app.
-    scryer_start_api(hostname, port, workers or 0)
+    if workers and workers > 1:
+        # Sessions live in the memory of a single
+        # process. Workers would each see a
+        # different set of them.
+        raise click.UsageError(
+            "--workers > 1 does not share sessions between workers, use --shards instead")
+    if shards:
+        scryer_start_sharded(hostname, port, shards, ws_deflate)
+    else:
+        scryer_start_api(hostname, port, workers or 0, ws_deflate)
 
 
 if __name__ == "__main__":
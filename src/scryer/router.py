@@ -0,0 +1,328 @@
+"""
+Front router for running the application as
+several sharded worker processes. Each request is
+sent to the worker owning the session it
+addresses, so a session's state only ever lives
+in one process.
+"""
+
+import asyncio, contextlib, itertools, json, logging, os, pathlib, signal, typing, urllib.parse, uuid
+
+from scryer.util.hashring import HashRing
+
+__all__ = ("ShardRouter", "route_key", "serve_sharded", "shard_names")
+
+logger = logging.getLogger(__name__)
+
+ROUTER_HEAD_LIMIT = 64 * 1024
+"""Largest request head accepted, in bytes."""
+
+ROUTER_PREFIXES = frozenset({"characters", "groups", "monsters", "sessions"})
+"""
+Route prefixes whose next path segment is the
+session being addressed.
+"""
+
+type StreamPair = tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+
+def route_key(target: str) -> str | None:
+    """
+    The session a request target addresses, if
+    any. Accepts targets with or without the `/api`
+    root path.
+    """
+
+    path  = target.split("?", 1)[0]
+    parts = [p for p in path.split("/") if p]
+    if parts[:1] == ["api"]:
+        parts = parts[1:]
+    if len(parts) < 2 or parts[0] not in ROUTER_PREFIXES:
+        return None
+
+    try:
+        return str(uuid.UUID(parts[1]))
+    except ValueError:
+        return None
+
+
+def _respond_error(writer: asyncio.StreamWriter, status: bytes, detail: str):
+    body  = json.dumps({"detail": detail}).encode()
+    lines = [
+        b"HTTP/1.1 " + status,
+        b"Content-Type: application/json",
+        b"Content-Length: %d" % len(body),
+        b"Connection: close"]
+    writer.write(b"\r\n".join(lines) + b"\r\n\r\n" + body)
+
+
+def shard_names(count: int) -> list[str]:
+    """Names of the workers of a sharded server."""
+
+    return [f"shard-{i}" for i in range(count)]
+
+
+def _head_rewrite(
+        head: bytes,
+        *,
+        version: bytes | None = None,
+        strip: tuple[bytes, ...] = ()) -> bytes:
+    """
+    Rewrite a request head so the worker closes
+    the connection after responding. Headers
+    starting with any of `strip` are dropped.
+    """
+
+    lines = head.rstrip(b"\r\n").split(b"\r\n")
+    if version:
+        method, target, _ = lines[0].split(b" ", 2)
+        lines[0] = b" ".join((method, target, version))
+
+    lines = [lines[0], *(
+        line for line in lines[1:]
+        if not line.lower().startswith((b"connection:", *strip))
+    )]
+    lines.append(b"Connection: close")
+    return b"\r\n".join(lines) + b"\r\n\r\n"
+
+
+async def _splice(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    with contextlib.suppress(ConnectionError):
+        while data := await reader.read(64 * 1024):
+            writer.write(data)
+            await writer.drain()
+    with contextlib.suppress(ConnectionError, OSError):
+        if writer.can_write_eof():
+            writer.write_eof()
+
+
+class ShardRouter:
+    """
+    Routes requests to sharded workers by a
+    consistent hash of the session they address.
+    Requests which address no session are spread
+    across workers, except listing sessions which
+    is answered by every worker.
+
+    Requests are not pipelined. Each connection
+    carries one request, or one websocket.
+    """
+
+    router_ring:    HashRing[str]
+    router_workers: dict[str, str]
+
+    _counter: itertools.count
+
+    def __init__(self, workers: typing.Mapping[str, str]):
+        self.router_ring    = HashRing()
+        self.router_workers = dict(workers)
+
+        self._counter = itertools.count()
+
+    async def _connect(self, node: str) -> StreamPair:
+        return await asyncio.open_unix_connection(self.router_workers[node])
+
+    async def _fan_out(self, head: bytes, target: str, writer: asyncio.StreamWriter):
+        # Cursors are local to each worker, and
+        # limits would apply to each worker apart.
+        query = urllib.parse.parse_qs(target.partition("?")[2])
+        if "cursor" in query or "limit" in query:
+            _respond_error(writer, b"400 Bad Request", "Pagination is not supported across shards")
+            await writer.drain()
+            return
+
+        # HTTP/1.0 responses are never chunked, so
+        # each body is simply read to the end. Bodies
+        # are merged, so they must not be compressed
+        # or answered with validators of one worker.
+        head = _head_rewrite(
+            head,
+            version=b"HTTP/1.0",
+            strip=(b"accept-encoding:", b"if-none-match:"))
+
+        async def fetch(node: str):
+            wreader, wwriter = await self._connect(node)
+            try:
+                wwriter.write(head)
+                await wwriter.drain()
+                return await wreader.read()
+            finally:
+                wwriter.close()
+
+        nodes     = sorted(self.router_ring.ring_nodes)
+        responses = await asyncio.gather(*map(fetch, nodes), return_exceptions=True)
+
+        # A partial listing would look complete to
+        # the client, so any worker failing fails
+        # the whole request.
+        found:   list[typing.Any] = []
+        headers: list[bytes]      = []
+        for response in responses:
+            try:
+                if isinstance(response, BaseException):
+                    raise response
+                rhead, _, body = response.partition(b"\r\n\r\n")
+                if not rhead.split(b" ", 2)[1:2] == [b"200"]:
+                    raise ValueError(rhead.split(b"\r\n", 1)[0])
+                found.extend(json.loads(body))
+            except (ConnectionError, OSError, ValueError):
+                logger.exception("Shard failed to answer a fanned out request")
+                _respond_error(writer, b"502 Bad Gateway", "A shard failed to respond")
+                await writer.drain()
+                return
+            headers = headers or rhead.split(b"\r\n")[1:]
+
+        body  = json.dumps(found, separators=(",", ":")).encode()
+        strip = (
+            b"connection:",
+            b"content-encoding:",
+            b"content-length:",
+            b"etag:",
+            b"transfer-encoding:",
+            b"x-next-cursor:")
+        lines = [b"HTTP/1.1 200 OK", *(
+            h for h in headers
+            if not h.lower().startswith(strip)
+        )]
+        lines += [b"Content-Length: %d" % len(body), b"Connection: close"]
+        writer.write(b"\r\n".join(lines) + b"\r\n\r\n" + body)
+        await writer.drain()
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve a single client connection."""
+
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            writer.close()
+            return
+
+        try:
+            method, target, _ = head.split(b"\r\n", 1)[0].decode("latin-1").split(" ", 2)
+            upgrade = b"\r\nupgrade:" in head.lower()
+            key     = route_key(target)
+            path    = target.split("?", 1)[0].removeprefix("/api").rstrip("/")
+
+            if key is None and method == "GET" and path == "/sessions":
+                await self._fan_out(head, target, writer)
+                return
+
+            node = self.worker_for(key)
+            if node is None:
+                writer.write(b"HTTP/1.1 503 Service Unavailable\r\nContent-Length: 0\r\nConnection: close\r\n\r\n")
+                await writer.drain()
+                return
+
+            wreader, wwriter = await self._connect(node)
+            try:
+                wwriter.write(head if upgrade else _head_rewrite(head))
+                await wwriter.drain()
+
+                # Request bodies and websocket frames
+                # flow until the worker is done.
+                upstream = asyncio.create_task(_splice(reader, wwriter))
+                await _splice(wreader, writer)
+                upstream.cancel()
+            finally:
+                wwriter.close()
+        except (ConnectionError, OSError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, hostname: str, port: int):
+        """Accept client connections forever."""
+
+        server = await asyncio.start_server(
+            self.handle,
+            hostname,
+            port,
+            limit=ROUTER_HEAD_LIMIT)
+        async with server:
+            await server.serve_forever()
+
+    def worker_for(self, key: str | None) -> str | None:
+        """
+        The worker which should serve a request for
+        the given session. Requests without a
+        session go to any worker.
+        """
+
+        if key is not None:
+            return self.router_ring.node_for(key)
+
+        nodes = sorted(self.router_ring.ring_nodes)
+        return nodes[next(self._counter) % len(nodes)] if nodes else None
+
+
+async def _worker_ready(path: str, proc: asyncio.subprocess.Process) -> bool:
+    while proc.returncode is None:
+        try:
+            _, writer = await asyncio.open_unix_connection(path)
+        except (ConnectionRefusedError, FileNotFoundError):
+            await asyncio.sleep(0.1)
+            continue
+        writer.close()
+        return True
+    return False
+
+
+async def _supervise(
+        router: ShardRouter,
+        node: str,
+        argv: typing.Sequence[str],
+        env: typing.Mapping[str, str]):
+
+    path = router.router_workers[node]
+    while True:
+        with contextlib.suppress(FileNotFoundError):
+            pathlib.Path(path).unlink()
+
+        proc = await asyncio.create_subprocess_exec(*argv, "--uds", path, env=env)
+        try:
+            # Sessions only move onto a worker once
+            # it can serve them.
+            if await _worker_ready(path, proc):
+                router.router_ring.add(node)
+            await proc.wait()
+        finally:
+            router.router_ring.remove(node)
+            if proc.returncode is None:
+                proc.terminate()
+                await proc.wait()
+
+        # The worker's sessions were lost with it.
+        # Its keys move to the remaining workers
+        # until it is back.
+        await asyncio.sleep(1.0)
+
+
+async def serve_sharded(
+        hostname: str,
+        port: int,
+        shards: int,
+        argv: typing.Sequence[str],
+        runtime: str | os.PathLike):
+    """
+    Run `shards` workers using `argv`, plus a
+    router in front of them listening on
+    `hostname:port`. Workers listen on Unix
+    sockets in `runtime`.
+    """
+
+    nodes  = shard_names(shards)
+    router = ShardRouter({
+        node: str(pathlib.Path(runtime, f"scryer-{port}-{node}.sock"))
+        for node in nodes
+    })
+
+    # Stop the workers along with the router,
+    # rather than leave them orphaned.
+    main = asyncio.current_task()
+    asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, main.cancel) #type: ignore
+
+    env = dict(os.environ, SCRYER_SHARDS=",".join(nodes))
+    async with asyncio.TaskGroup() as tg:
+        for node in nodes:
+            tg.create_task(_supervise(router, node, argv, {**env, "SCRYER_SHARD": node}))
+        tg.create_task(router.serve(hostname, port))
@@ -10,8 +10,14 @@ __all__ = (
     "CombatSession",
     "EventBroker",
     "EventMemoryBroker",
+    "EvictionPolicy",
+    "Heartbeat",
+    "LRUPolicy",
     "MemoryBroker",
+    "Outbox",
+    "OverflowPolicy",
     "RedisBroker",
+    "SessionJournal",
     "Service",
     "ServiceStatus",
     "Session",
@@ -20,8 +26,14 @@ __all__ = (
     "SessionShelver",
     "SessionSocket",
     "ShelfBroker",
+    "SizePolicy",
     "SocketBroker",
     "SocketMemoryBroker",
+    "TTLPolicy",
+    "cursor_offset",
+    "dumps_session",
+    "loads_session",
+    "next_cursor",
     "send_event_action"
 )
 
@@ -29,10 +41,19 @@ from scryer.services.brokers import (
     Broker,
     MemoryBroker,
     RedisBroker,
-    ShelfBroker
+    ShelfBroker,
+    cursor_offset,
+    next_cursor
 )
 from scryer.services.creatures import CreaturesMemoryBroker
 from scryer.services.events import EventBroker, EventMemoryBroker
+from scryer.services.eviction import (
+    EvictionPolicy,
+    LRUPolicy,
+    SizePolicy,
+    TTLPolicy
+)
+from scryer.services.outbox import Outbox, OverflowPolicy
 from scryer.services.service import Service, ServiceStatus
 from scryer.services.sessions import (
     Action,
@@ -41,8 +62,12 @@ from scryer.services.sessions import (
     SessionMemoryBroker,
     SessionRedisBroker,
     SessionShelver,
+    dumps_session,
+    loads_session,
     send_event_action
 )
+from scryer.services.heartbeat import Heartbeat
+from scryer.services.journal import SessionJournal
 from scryer.services.sockets import (
     SessionSocket,
     SocketBroker,
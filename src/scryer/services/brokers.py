@@ -1,14 +1,44 @@
-import abc, asyncio, math, time, typing
+import abc, asyncio, base64, collections, inspect, itertools, json, logging, math, threading, time, typing
 
 import redis
+import redis.asyncio as aioredis
 
+from scryer.services.eviction import EvictionPolicy
 from scryer.services.service import Service, ServiceStatus
 from scryer.util import shelves
-from scryer.util.filters import FilterStatement, compose_validator
+from scryer.util.filters import (
+    NOT_FOUND,
+    FilterStatement,
+    LogicalOp,
+    compile_statement,
+    resolve_field
+)
+
+logger = logging.getLogger(__name__)
 
 type LocatedPair[K, R] = tuple[K, R]
 type Located[K, R] = typing.Sequence[LocatedPair[K, R]]
 type Locator[K: typing.Hashable, R] = typing.Callable[[K], R | None]
+type Listener[K, R] = typing.Callable[[str, K, R | None], None]
+"""
+Callback notified of changes to a broker. Passed
+the operation (`put` or `pop`), the key and the
+resource, if any.
+"""
+type Evictor[K, R] = typing.Callable[[K, R], typing.Awaitable[bool | None] | bool | None]
+"""
+Callback passed each entry evicted from a broker.
+Awaitable results are scheduled as a task. The
+entry stays in the broker until the callback is
+done, and is kept if it returns `False` or
+raises.
+"""
+
+_SHELF_DELETED = object()
+"""
+Marks a shelf entry as deleted but not yet
+flushed.
+"""
 
 
 class Broker[K, R](Service):
@@ -21,11 +51,28 @@ class Broker[K, R](Service):
     @abc.abstractmethod
     async def create(self) -> tuple[K, R]:
         """Create a new resource instance."""
+    async def create_many(
+            self,
+            params: typing.Iterable[typing.Mapping[str, typing.Any]]) -> list[LocatedPair[K, R]]:
+        """
+        Create a resource instance for each mapping
+        of key-word arguments to `create`.
+        """
+
+        return [await self.create(**p) for p in params] #type: ignore
     @abc.abstractmethod
     async def delete(self, key: K) -> None:
         """
         Delete a resource related to the key.
         """
+    async def delete_many(self, keys: typing.Iterable[K]) -> None:
+        """
+        Delete the resources related to all of the
+        given keys.
+        """
+
+        for key in keys:
+            await self.delete(key)
     @abc.abstractmethod
     async def locate(
             self,
@@ -35,6 +82,16 @@ class Broker[K, R](Service):
         Attempt to find resources that are related
         to the given keys.
         """
+    async def locate_many(self, keys: typing.Iterable[K]) -> list[R | None]:
+        """
+        Fetch the resource related to each key, in
+        the order of the given keys. Missing
+        resources are `None`.
+        """
+
+        keys  = tuple(keys)
+        found = dict(await self.locate(*keys))
+        return [found.get(k) for k in keys]
     # This is just syntactic sugar here, but it
     # helps us identify what inputs our method
     # should be allowed to accept. The method at
@@ -54,6 +111,146 @@ class Broker[K, R](Service):
         """
         Push changes to an existing resource.
         """
+    async def modify_many(self, items: typing.Iterable[LocatedPair[K, R]]) -> None:
+        """
+        Push changes to many resources at once,
+        given as key/resource pairs.
+        """
+
+        for key, resource in items:
+            await self.modify(key, resource)
+
+    async def shutdown(self) -> None:
+        """
+        Release anything held by this broker. Called
+        once when the application stops.
+        """
+
+    async def startup(self) -> None:
+        """
+        Prepare this broker for use. Called once
+        when the application starts.
+        """
+
+    async def stream(
+            self,
+            *keys: K,
+            statement: FilterStatement | None = None,
+            limit: int | None = None,
+            cursor: str | None = None) -> typing.AsyncIterator[LocatedPair[K, R]]:
+        """
+        Iterate over the resources `locate` would
+        find, one at a time. Yields at most `limit`
+        resources, starting from `cursor`; see
+        `next_cursor` for the following page.
+        """
+
+        offset = cursor_offset(cursor)
+        found  = await self.locate(*keys, statement=statement)
+        for pair in _paginate(found, offset, limit):
+            yield pair
+
+    async def stream_page(
+            self,
+            *keys: K,
+            statement: FilterStatement | None = None,
+            limit: int | None = None,
+            cursor: str | None = None) -> tuple[list[LocatedPair[K, R]], str | None]:
+        """
+        Collect the page `stream` would yield.
+        Returns it with the cursor of the following
+        page, or `None` when there is none to
+        give. Raises `ValueError` if the cursor is
+        invalid.
+        """
+
+        found = [
+            pair async for pair in self.stream(
+                *keys,
+                statement=statement,
+                limit=limit,
+                cursor=cursor)
+        ]
+        return found, None if limit is None else next_cursor(cursor, limit)
+
+
+class FieldIndex[K: typing.Hashable]:
+    """
+    Secondary index of resource keys by the value
+    found at a dotted field path.
+    """
+
+    field:       str
+    field_parts: tuple[str, ...]
+    # Buckets are dictionaries used as ordered
+    # sets so lookups keep insertion order.
+    buckets:     dict[typing.Hashable, dict[K, None]]
+    entries:     dict[K, typing.Hashable]
+    unhashable:  dict[K, None]
+
+    def __init__(self, field: str):
+        self.field       = field
+        self.field_parts = tuple(field.split("."))
+        self.buckets     = dict()
+        self.entries     = dict()
+        self.unhashable  = dict()
+
+    def add(self, key: K, resource: object):
+        """
+        Index the resource under the given key.
+        Replaces any previous entry for the key.
+        """
+
+        try:
+            value = resolve_field(resource, self.field_parts)
+        except AttributeError:
+            value = NOT_FOUND
+
+        # Leave unchanged entries where they are
+        # so buckets keep their original order.
+        if key in self.entries and self.entries[key] == value:
+            return
+
+        self.discard(key)
+        if value is NOT_FOUND:
+            return
+
+        try:
+            self.buckets.setdefault(value, dict())[key] = None
+        except TypeError:
+            # Values that cannot be hashed are
+            # always yielded as candidates and left
+            # to the validator.
+            self.unhashable[key] = None
+            return
+        self.entries[key] = value
+
+    def candidates(self, value: typing.Any) -> typing.Collection[K]:
+        """
+        Keys of resources which may have the given
+        value at this field.
+        """
+
+        try:
+            found = self.buckets.get(value, {})
+        except TypeError:
+            return (*self.entries, *self.unhashable)
+        if not self.unhashable:
+            return found
+        return (*found, *self.unhashable)
+
+    def discard(self, key: K):
+        """Remove the key from this index."""
+
+        self.unhashable.pop(key, None)
+        if key not in self.entries:
+            return
+
+        value  = self.entries.pop(key)
+        bucket = self.buckets[value]
+        bucket.pop(key, None)
+        if not bucket:
+            del self.buckets[value]
 
 
 class MemoryBroker[K: typing.Hashable, R](Broker[K, R]):
@@ -61,57 +258,421 @@ class MemoryBroker[K: typing.Hashable, R](Broker[K, R]):
     Some key/value storage that occurs in-memory.
     """
 
-    resource_cls:          type[R]
-    resource_map:          typing.MutableMapping[K, R]
-    resource_map_capacity: typing.SupportsInt | typing.SupportsFloat
+    resource_cls:            type[R]
+    resource_eviction:       EvictionPolicy[K] | None
+    resource_evict_interval: float
+    resource_indexes:        dict[str, FieldIndex[K]]
+    resource_listeners:      list[Listener[K, R]]
+    resource_map:            typing.MutableMapping[K, R]
+    resource_map_capacity:   typing.SupportsInt | typing.SupportsFloat
+    resource_on_evict:       Evictor[K, R] | None
+    resource_reserved:       int
+    resource_stats:          collections.Counter[str]
+    resource_waiters:        collections.deque[asyncio.Future[None]]
+    resource_waiters_max:    int | None
+
+    _evict_pending: set[K]
+    _evict_sweeper: asyncio.Task | None
+    _evict_tasks:   set[asyncio.Task]
+
+    def __init__(
+            self,
+            cls: type[R],
+            max_size: int | None = None,
+            *,
+            indexes: typing.Iterable[str] = (),
+            max_waiters: int | None = None,
+            eviction: EvictionPolicy[K] | None = None,
+            evict_interval: float = 30.0,
+            on_evict: Evictor[K, R] | None = None):
+        """
+        Initialize a `MemoryBroker`. Field paths
+        listed in `indexes` are indexed so `EQ`
+        filters against them skip the full scan.
+        At most `max_waiters` callers may wait for
+        capacity at once, further callers are
+        rejected immediately.
+
+        With an `eviction` policy, entries are
+        evicted to make room instead of waiting
+        for capacity, and expired entries are swept
+        every `evict_interval` seconds once
+        started. Each evicted entry is passed to
+        `on_evict`, and only removed once it is
+        done without returning `False`.
+        """
 
-    def __init__(self,  cls: type[R], max_size: int | None = None):
         self.resource_map_capacity = max_size or math.inf
         self.resource_map = dict()
         self.resource_cls = cls
+        self.resource_indexes = {f: FieldIndex(f) for f in indexes}
+        self.resource_listeners = list()
+        self.resource_reserved = 0
+        self.resource_waiters = collections.deque()
+        self.resource_waiters_max = max_waiters
+        self.resource_eviction = eviction
+        self.resource_evict_interval = evict_interval
+        self.resource_on_evict = on_evict
+        self.resource_stats = collections.Counter()
+
+        self._evict_pending = set()
+        self._evict_sweeper = None
+        self._evict_tasks   = set()
 
     def __iter__(self):
         return iter(self.resource_map.values())
 
     @property
     def _capacity_delta(self):
-        return self.resource_map_capacity - len(self.resource_map) #type: ignore
+        # Slots handed off to a waiter which has
+        # not resumed yet are already spoken for.
+        return (
+            self.resource_map_capacity #type: ignore
+            - len(self.resource_map)
+            - self.resource_reserved)
+
+    @property
+    def stats(self) -> dict[str, typing.Any]:
+        """
+        Counters of lookups and evictions, along
+        with the current size of this broker.
+        """
+
+        capacity = self.resource_map_capacity
+        return {
+            "size": len(self.resource_map),
+            "capacity": None if capacity == math.inf else capacity,
+            "waiters": len(self.resource_waiters),
+            "hits": self.resource_stats["hits"],
+            "misses": self.resource_stats["misses"],
+            "evictions": self.resource_stats["evictions"]
+        }
 
     @property
     def status(self):
-        if self._capacity_delta > 0:
+        if self._capacity_delta > 0 or self.resource_eviction:
             return ServiceStatus.ONLINE
         else:
             return ServiceStatus.BUSY
 
+    async def _evict_sweep_loop(self):
+        while True:
+            await asyncio.sleep(self.resource_evict_interval)
+            self._resource_evict()
+
+    def _resource_evict(self):
+        """
+        Evict expired entries, then the policy's
+        victims until this broker is within its
+        bounds.
+        """
+
+        policy = self.resource_eviction
+        if policy is None:
+            return
+
+        for key in policy.expired():
+            self._resource_evict_one(key)
+        # Entries still being handed to `on_evict`
+        # are already on their way out.
+        while self.resource_map and (
+                policy.overflowing()
+                or self._capacity_delta + len(self._evict_pending) < 0):
+            key = policy.victim()
+            if key is None:
+                break
+            self._resource_evict_one(key)
+
+    def _resource_evict_one(self, key: K):
+        resource = self.resource_map.get(key)
+        # The policy must not pick the entry again
+        # while it is handed off.
+        self.resource_eviction.discard(key) #type: ignore
+        if resource is None:
+            return
+
+        if not self.resource_on_evict:
+            self._resource_evict_done(key, resource, True)
+            return
+
+        try:
+            result = self.resource_on_evict(key, resource)
+        except Exception:
+            logger.exception("Failed to evict %s, keeping it", key)
+            result = False
+
+        if inspect.isawaitable(result):
+            self._evict_pending.add(key)
+            task = asyncio.ensure_future(self._resource_evict_wait(key, resource, result))
+            self._evict_tasks.add(task)
+            task.add_done_callback(self._evict_tasks.discard)
+        else:
+            self._resource_evict_done(key, resource, result)
+
+    def _resource_evict_done(self, key: K, resource: R, accepted: bool | None):
+        self._evict_pending.discard(key)
+        if self.resource_map.get(key) is not resource:
+            # Replaced or removed in the meantime.
+            return
+        if accepted is False:
+            # Keep the entry. The policy will pick it
+            # again later.
+            self.resource_eviction.put(key, resource) #type: ignore
+            return
+
+        self._resource_pop(key)
+        self.resource_stats["evictions"] += 1
+
+    async def _resource_evict_wait(
+            self,
+            key: K,
+            resource: R,
+            pending: typing.Awaitable[bool | None]):
+
+        try:
+            accepted = await pending
+        except Exception:
+            logger.exception("Failed to evict %s, keeping it", key)
+            accepted = False
+        self._resource_evict_done(key, resource, accepted)
+
+    def _resource_pop(self, key: K) -> R | None:
+        """
+        Remove a resource from the map and any
+        declared indexes.
+        """
+
+        for index in self.resource_indexes.values():
+            index.discard(key)
+        if self.resource_eviction:
+            self.resource_eviction.discard(key)
+
+        resource = self.resource_map.pop(key, None)
+        if resource is not None:
+            for listener in self.resource_listeners:
+                listener("pop", key, resource)
+            self._waiter_wake()
+        return resource
+
+    def _resource_put(self, key: K, resource: R):
+        """
+        Insert or replace a resource in the map,
+        keeping declared indexes up to date.
+        """
+
+        self.resource_map[key] = resource
+        for index in self.resource_indexes.values():
+            index.add(key, resource)
+        for listener in self.resource_listeners:
+            listener("put", key, resource)
+        if self.resource_eviction:
+            self.resource_eviction.put(key, resource)
+            self._resource_evict()
+
+    def _resource_candidates(
+            self,
+            statement: FilterStatement) -> typing.Collection[K] | None:
+        """
+        Narrow the keys a statement could match
+        using declared indexes. Returns `None` if
+        no index applies and a full scan is
+        required.
+        """
+
+        if not self.resource_indexes or not statement["filters"]:
+            return None
+        if LogicalOp.from_other(statement["logic"]) is not LogicalOp.AND:
+            return None
+
+        found = []
+        for f in statement["filters"]:
+            index = self.resource_indexes.get(f["field"])
+            if not index or LogicalOp.from_other(f["operator"]) is not LogicalOp.EQ:
+                continue
+            found.append(index.candidates(f["value"]))
+
+        if not found:
+            return None
+
+        found.sort(key=len)
+        smallest, others = found[0], found[1:]
+        return [k for k in smallest if all(k in o for o in others)]
+
+    def _waiter_abandon(self, waiter: asyncio.Future[None]):
+        """
+        Withdraw a waiter which timed out or was
+        cancelled. A slot already handed to it is
+        passed on to the next waiter in line.
+        """
+
+        if waiter.done() and not waiter.cancelled():
+            self.resource_reserved -= 1
+            self._waiter_wake()
+            return
+
+        waiter.cancel()
+        try:
+            self.resource_waiters.remove(waiter)
+        except ValueError:
+            pass
+
+    def _waiter_wake(self):
+        """
+        Hand free slots to waiters in the order
+        they started waiting.
+        """
+
+        while self.resource_waiters and self._capacity_delta > 0:
+            waiter = self.resource_waiters.popleft()
+            if waiter.done():
+                continue
+            waiter.set_result(None)
+            self.resource_reserved += 1
+
+    def observe(self, listener: Listener[K, R]):
+        """
+        Register a callback notified whenever a
+        resource is put into, or popped from, this
+        broker.
+        """
+
+        self.resource_listeners.append(listener)
+
     async def delete(self, key: K):
-        self.resource_map.pop(key, None)
+        self._resource_pop(key)
+
+    async def delete_many(self, keys: typing.Iterable[K]):
+        for key in keys:
+            self._resource_pop(key)
 
     async def locate(
             self,
             *keys: K,
             statement: FilterStatement | None = None) -> Located[K, R]:
 
-        locator = lambda key: self.resource_map.get(key, None)
-        return _locate_any(
-            locator,
-            keys or self.resource_map.keys(), #type: ignore
-            statement)
+        self._resource_evict()
+        if not keys:
+            locator = lambda key: self.resource_map.get(key, None)
+            candidates = None
+            if statement:
+                candidates = self._resource_candidates(statement)
+            if candidates is None:
+                candidates = self.resource_map.keys()
+            return _locate_any(locator, candidates, statement) #type: ignore
+
+        # Only direct lookups count towards hits
+        # and misses, or mark entries as used.
+        def locator(key: K) -> R | None:
+            resource = self.resource_map.get(key, None)
+            if resource is None:
+                self.resource_stats["misses"] += 1
+                return None
+
+            self.resource_stats["hits"] += 1
+            if self.resource_eviction:
+                self.resource_eviction.access(key)
+            return resource
+
+        return _locate_any(locator, keys, statement)
+
+    async def locate_many(self, keys: typing.Iterable[K]):
+        self._resource_evict()
+        keys  = tuple(keys)
+        found = [self.resource_map.get(k, None) for k in keys]
+
+        hits = sum(1 for r in found if r is not None)
+        self.resource_stats["hits"] += hits
+        self.resource_stats["misses"] += len(found) - hits
+        if self.resource_eviction:
+            for key in keys:
+                self.resource_eviction.access(key)
+        return found
 
     async def modify(self, key: K, resource: R) -> None:
-        self.resource_map[key] = resource
+        self._resource_put(key, resource)
+
+    async def modify_many(self, items: typing.Iterable[LocatedPair[K, R]]):
+        for key, resource in items:
+            self._resource_put(key, resource)
+
+    async def shutdown(self):
+        if self._evict_sweeper:
+            self._evict_sweeper.cancel()
+            self._evict_sweeper = None
+
+    async def startup(self):
+        if self.resource_eviction and not self._evict_sweeper:
+            self._evict_sweeper = asyncio.create_task(self._evict_sweep_loop())
+
+    async def stream(
+            self,
+            *keys: K,
+            statement: FilterStatement | None = None,
+            limit: int | None = None,
+            cursor: str | None = None):
+
+        if keys:
+            async for pair in super().stream(
+                    *keys,
+                    statement=statement,
+                    limit=limit,
+                    cursor=cursor):
+                yield pair
+            return
+
+        offset = cursor_offset(cursor)
+        self._resource_evict()
+
+        candidates = None
+        if statement:
+            candidates = self._resource_candidates(statement)
+        # Iterate over a copy; the map may change
+        # while the caller is suspended.
+        candidates = list(self.resource_map if candidates is None else candidates)
+
+        isvalid = compile_statement(statement) if statement else (lambda _: True)
+        located = ((k, self.resource_map.get(k, None)) for k in candidates)
+        found   = (p for p in located if p[1] is not None and isvalid(p[1]))
+        for pair in _paginate(found, offset, limit):
+            yield pair
 
     async def wait_ready(self, timeout: float | None = None) -> bool:
         """
         Wait until this broker is ready to accept
-        an entry.
+        an entry. Waiters are woken first come,
+        first served as entries are deleted.
+        Returns `False` if `timeout` elapses first,
+        or if too many callers are already waiting.
+
+        The caller must insert its entry before
+        yielding to the event loop again, otherwise
+        the slot may be taken by someone else.
+        Brokers with an eviction policy never wait;
+        inserting evicts an entry instead.
         """
 
-        start = time.monotonic()
-        while self.status is ServiceStatus.BUSY:
-            await asyncio.sleep(0.1)
-            if timeout and timeout <= (time.monotonic() - start):
-                return False
+        if self.resource_eviction:
+            return True
+        if not self.resource_waiters and self._capacity_delta > 0:
+            return True
+
+        limit = self.resource_waiters_max
+        if limit is not None and len(self.resource_waiters) >= limit:
+            return False
+
+        waiter = asyncio.get_running_loop().create_future()
+        self.resource_waiters.append(waiter)
+        try:
+            async with asyncio.timeout(timeout):
+                await waiter
+        except TimeoutError:
+            self._waiter_abandon(waiter)
+            return False
+        except asyncio.CancelledError:
+            self._waiter_abandon(waiter)
+            raise
+
+        self.resource_reserved -= 1
         return True
 
 
@@ -121,43 +682,302 @@ class RedisBroker[K, R](Broker[K, R]):
     interacts with a `Redis` server.
     """
 
-    resource_cls: type[R]
-    redis_client: redis.Redis
+    resource_cls:         type[R]
+    redis_batch_size:     int
+    redis_client:         aioredis.Redis
+    redis_probe_interval: float
+    redis_status:         ServiceStatus
+
+    # Connection pools are shared between brokers
+    # connecting to the same server with the same
+    # options.
+    redis_pools: typing.ClassVar[dict[tuple[str, frozenset], aioredis.ConnectionPool]] = {}
 
-    def __init__(self, cls: type[R], url: str, **kwds):
+    _redis_probe:  asyncio.Task | None
+    _redis_probed: float
+
+    def __init__(
+            self,
+            cls: type[R],
+            url: str,
+            *,
+            batch_size: int = 500,
+            client: aioredis.Redis | None = None,
+            probe_interval: float = 5.0,
+            **kwds):
         """
         Initialize a `RedisBroker` instance from
         a `URL` connection string. By default,
         this implementation decodes responses from
         the server into Python native strings
         instead of bytes.
+
+        An already configured `client` can be
+        given in place of the pooled connection,
+        e.g. an in-process fake for testing.
         """
 
-        self.resource_cls = cls
-        self.redis_client = redis.Redis.from_url( #type: ignore
-            url,
-            decode_responses=True,
-            **kwds)
+        self.resource_cls         = cls
+        self.redis_batch_size     = batch_size
+        self.redis_probe_interval = probe_interval
+        self.redis_status         = ServiceStatus.OFFLINE
+
+        self._redis_probe  = None
+        self._redis_probed = -math.inf
+
+        if not client:
+            client = aioredis.Redis(connection_pool=self._redis_pool(url, **kwds))
+        self.redis_client = client
 
     @property
     def status(self):
-        available = self.redis_client.ping()
-        return ServiceStatus.ONLINE if available else ServiceStatus.UNAVAILABLE
+        # Pinging the server here would block the
+        # caller. Instead, report the last known
+        # status and refresh it in the background.
+        self._status_refresh()
+        return self.redis_status
 
-    async def delete(self, key: str):
-        self.redis_client.delete(key)
+    @classmethod
+    def _redis_pool(cls, url: str, **kwds) -> aioredis.ConnectionPool:
+        """
+        The connection pool for `url` and the given
+        options. Options which are not hashable
+        cannot be compared, so they get a pool of
+        their own rather than a shared one.
+        """
+
+        try:
+            pool_key = (url, frozenset(kwds.items()))
+            pool     = cls.redis_pools.get(pool_key)
+        except TypeError:
+            return aioredis.ConnectionPool.from_url(url, decode_responses=True, **kwds)
+
+        if pool is None:
+            pool = aioredis.ConnectionPool.from_url(url, decode_responses=True, **kwds)
+            cls.redis_pools[pool_key] = pool
+        return pool
+
+    def _redis_key(self, key: K | str) -> str:
+        """
+        The key a resource is stored under on the
+        `Redis` server.
+        """
+
+        return f"{self.resource_cls.__name__}:{key!s}"
+
+    def _resource_dumps(self, resource: R) -> str:
+        """
+        Serialize a resource for storage on the
+        `Redis` server.
+        """
+
+        return json.dumps(resource)
+
+    def _resource_key(self, rkey: str) -> K:
+        """
+        Parse the broker key from a key stored on
+        the `Redis` server.
+        """
+
+        return rkey.removeprefix(self._redis_key("")) #type: ignore
+
+    def _resource_loads(self, data: str) -> R:
+        """
+        Deserialize a resource stored on the
+        `Redis` server.
+        """
+
+        return json.loads(data)
+
+    async def _redis_mget(self, rkeys: list[str]) -> list[str | None]:
+        """
+        Fetch the values stored at many keys.
+        """
+
+        if not rkeys:
+            return []
+
+        # Fetch all batches in a single round trip.
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            for batch in itertools.batched(rkeys, self.redis_batch_size):
+                pipe.mget(batch)
+            return list(itertools.chain.from_iterable(await pipe.execute()))
+
+    def _status_refresh(self):
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+
+        if self._redis_probe and not self._redis_probe.done():
+            return
+        if time.monotonic() - self._redis_probed < self.redis_probe_interval:
+            return
+        self._redis_probe = loop.create_task(self.probe())
+
+    async def delete(self, key: K):
+        await self.redis_client.delete(self._redis_key(key))
+
+    async def delete_many(self, keys: typing.Iterable[K]):
+        rkeys = [self._redis_key(k) for k in keys]
+        if not rkeys:
+            return
+
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            for batch in itertools.batched(rkeys, self.redis_batch_size):
+                pipe.delete(*batch)
+            await pipe.execute()
 
     async def locate(
         self,
         *keys: K,
         statement: FilterStatement | None = None) -> Located[K, R]:
 
-        locator = lambda key: self.redis_client.get(key)
-        rkeys   = self.redis_client.keys("|".join(map(str, keys)) if keys else "*")
-        return _locate_any( #type: ignore
-            locator,
-            rkeys, #type: ignore
-            statement)
+        if keys:
+            rkeys = [self._redis_key(k) for k in keys]
+        else:
+            rkeys = [
+                rk async for rk in self.redis_client.scan_iter(
+                    match=self._redis_key("*"),
+                    count=self.redis_batch_size)
+            ]
+
+        loaded = {
+            self._resource_key(rk): self._resource_loads(v)
+            for rk, v in zip(rkeys, await self._redis_mget(rkeys)) if v is not None
+        }
+        return _locate_any(loaded.get, tuple(loaded), statement) #type: ignore
+
+    async def locate_many(self, keys: typing.Iterable[K]):
+        values = await self._redis_mget([self._redis_key(k) for k in keys])
+        return [None if v is None else self._resource_loads(v) for v in values]
+
+    async def modify(self, key: K, resource: R):
+        await self.redis_client.set(
+            self._redis_key(key),
+            self._resource_dumps(resource))
+
+    async def modify_many(self, items: typing.Iterable[LocatedPair[K, R]]):
+        mapping = {self._redis_key(k): self._resource_dumps(r) for k, r in items}
+        if not mapping:
+            return
+
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            for batch in itertools.batched(mapping.items(), self.redis_batch_size):
+                pipe.mset(dict(batch))
+            await pipe.execute()
+
+    async def stream(
+            self,
+            *keys: K,
+            statement: FilterStatement | None = None,
+            limit: int | None = None,
+            cursor: str | None = None):
+
+        if keys:
+            async for pair in super().stream(
+                    *keys,
+                    statement=statement,
+                    limit=limit,
+                    cursor=cursor):
+                yield pair
+            return
+
+        count = 0
+        async for pair, _ in self._redis_scan(statement, cursor):
+            yield pair
+            count += 1
+            if limit is not None and count >= limit:
+                return
+
+    async def stream_page(
+            self,
+            *keys: K,
+            statement: FilterStatement | None = None,
+            limit: int | None = None,
+            cursor: str | None = None) -> tuple[list[LocatedPair[K, R]], str | None]:
+
+        if keys:
+            return await super().stream_page(
+                *keys,
+                statement=statement,
+                limit=limit,
+                cursor=cursor)
+
+        found: list[LocatedPair[K, R]] = []
+        after: str | None              = None
+        async for pair, after in self._redis_scan(statement, cursor):
+            found.append(pair)
+            if limit is not None and len(found) >= limit:
+                return found, after
+        # The scan completed before the page was
+        # filled.
+        return found, None
+
+    async def _redis_scan(
+            self,
+            statement: FilterStatement | None,
+            cursor: str | None) -> typing.AsyncIterator[tuple[LocatedPair[K, R], str | None]]:
+        """
+        Scan the resources matching `statement`,
+        one `SCAN` batch at a time. Each is yielded
+        with the cursor resuming after it, or `None`
+        when the scan is complete.
+
+        As with `SCAN` itself, keys written between
+        pages may be missed or seen twice.
+        """
+
+        scan, skip = _scan_cursor(cursor)
+        isvalid    = compile_statement(statement) if statement else (lambda _: True)
+
+        # SCAN may return a key more than once.
+        seen = set()
+        while True:
+            after, batch = await self.redis_client.scan(
+                scan,
+                match=self._redis_key("*"),
+                count=self.redis_batch_size)
+            found = await self._redis_mget(batch[skip:])
+            for pos, (rk, data) in enumerate(zip(batch[skip:], found), skip + 1):
+                if data is None or rk in seen:
+                    continue
+                seen.add(rk)
+
+                resource = self._resource_loads(data)
+                if not isvalid(resource):
+                    continue
+                resume: str | None = None
+                if pos < len(batch):
+                    resume = _next_scan_cursor(scan, pos)
+                elif after:
+                    resume = _next_scan_cursor(after, 0)
+                yield (self._resource_key(rk), resource), resume
+
+            if not after:
+                return
+            scan, skip = after, 0
+
+    async def probe(self, timeout: float = 1.0) -> ServiceStatus:
+        """
+        Ping the `Redis` server and update the
+        known status of this broker.
+        """
+
+        try:
+            available = await asyncio.wait_for(self.redis_client.ping(), timeout)
+        except (asyncio.TimeoutError, OSError, redis.RedisError):
+            available = False
+
+        self._redis_probed = time.monotonic()
+        self.redis_status  = (
+            ServiceStatus.ONLINE if available else ServiceStatus.UNAVAILABLE)
+        return self.redis_status
+
+    async def startup(self):
+        # Know whether the server is reachable
+        # before the first request asks.
+        await self.probe()
 
 
 class ShelfBroker[R](Broker[str, R]):
@@ -165,49 +985,284 @@ class ShelfBroker[R](Broker[str, R]):
     A partial implementation of a broker which
     utilizes the `shelve` module to store
     resources persistently.
+
+    The shelf is opened once and kept open. Once
+    started, changes are written behind: they are
+    held as dirty entries and flushed to the shelf
+    in batches every `flush_interval` seconds, or
+    sooner when `flush_size` entries are waiting.
+    Batches are written from a worker thread; a
+    batch which fails to write is kept dirty.
     """
 
-    resource_cls: type[R]
-    shelf:        shelves.Shelf
+    resource_cls:         type[R]
+    shelf:                shelves.Shelf | None
+    shelf_dirty:          dict[str, typing.Any]
+    shelf_flushing:       dict[str, typing.Any]
+    shelf_flush_interval: float
+    shelf_flush_size:     int
+    shelf_name:           str
+
+    _shelf_flusher:     asyncio.Task | None
+    _shelf_flush_ready: asyncio.Event
+    _shelf_lock:        threading.Lock
+    _shelf_writer:      asyncio.Future | None
+
+    def __init__(
+            self,
+            shelf_name: str,
+            cls: type[R],
+            *,
+            flush_interval: float = 1.0,
+            flush_size: int = 64) -> None:
 
-    def __init__(self, shelf_name: str, cls: type[R]) -> None:
         self.resource_cls = cls
         self.shelf_name   = shelf_name
+        self.shelf          = None
+        self.shelf_dirty    = dict()
+        self.shelf_flushing = dict()
 
-    # `__enter__` and `__exit__` are special
-    # methods in Python. They allow us to override
-    # or extend built-in behaviors, and in this
-    # case, allows us to use this class as a
-    # context manager. This is where you'll see
-    # the `with self` statements. Think of
-    # `__enter__` as the setup and `__exit__` as
-    # the teardown.
-    def __enter__(self):
-        self.shelf = shelves.open(self.shelf_name)
-        return self
-
-    def __exit__(self, *_):
-        self.shelf.close() #type: ignore
+        self.shelf_flush_interval = flush_interval
+        self.shelf_flush_size     = flush_size
+
+        self._shelf_flusher     = None
+        self._shelf_flush_ready = asyncio.Event()
+        self._shelf_lock        = threading.Lock()
+        self._shelf_writer      = None
 
     @property
     def status(self):
         return ServiceStatus.ONLINE
 
+    def _resource_dumps(self, resource: R) -> typing.Any:
+        """
+        Transform a resource before it is written
+        to the shelf. By default, resources are
+        left to be pickled by the shelf.
+        """
+
+        return resource
+
+    def _resource_loads(self, data: typing.Any) -> R:
+        """
+        Transform a value read from the shelf back
+        into a resource.
+        """
+
+        return data
+
+    def _shelf_get(self, key: str) -> typing.Any:
+        for pending in (self.shelf_dirty, self.shelf_flushing):
+            if key in pending:
+                data = pending[key]
+                return None if data is _SHELF_DELETED else data
+        with self._shelf_lock:
+            return self._shelf_open().get(key, None)
+
+    def _shelf_mark(self, key: str, data: typing.Any):
+        """
+        Record a pending change to the shelf.
+        """
+
+        self._shelf_mark_many({key: data})
+
+    def _shelf_mark_many(self, changes: typing.Mapping[str, typing.Any]):
+        """
+        Record many pending changes to the shelf
+        as one batch.
+        """
+
+        self.shelf_dirty.update(changes)
+        if not self._shelf_flusher:
+            # Not started with the application;
+            # write through instead.
+            self.flush()
+        elif len(self.shelf_dirty) >= self.shelf_flush_size:
+            self._shelf_flush_ready.set()
+
+    def _shelf_open(self) -> shelves.Shelf:
+        if self.shelf is None:
+            self.shelf = shelves.open(self.shelf_name)
+        return self.shelf
+
+    async def _shelf_flush(self):
+        """
+        Write pending changes to the shelf from a
+        worker thread. Until written, they are
+        still read from `shelf_flushing`.
+        """
+
+        if not self.shelf_dirty:
+            return
+
+        shelf = self._shelf_open()
+        self.shelf_flushing, self.shelf_dirty = self.shelf_dirty, dict()
+        self._shelf_writer = asyncio.ensure_future(
+            asyncio.to_thread(self._shelf_write, shelf, self.shelf_flushing))
+        self._shelf_writer.add_done_callback(self._shelf_written)
+        # Shielded so a cancelled flusher does not
+        # leave the batch half handled.
+        await asyncio.shield(self._shelf_writer)
+
+    async def _shelf_flush_loop(self):
+        while True:
+            try:
+                await asyncio.wait_for(
+                    self._shelf_flush_ready.wait(),
+                    self.shelf_flush_interval)
+            except TimeoutError:
+                pass
+            self._shelf_flush_ready.clear()
+            try:
+                await self._shelf_flush()
+            except Exception:
+                logger.exception("Failed to flush shelf %s", self.shelf_name)
+
+    def _shelf_write(self, shelf: shelves.Shelf, changes: typing.Mapping[str, typing.Any]):
+        for key, data in changes.items():
+            with self._shelf_lock:
+                if data is _SHELF_DELETED:
+                    shelf.pop(key, None)
+                else:
+                    shelf[key] = data
+        with self._shelf_lock:
+            shelf.sync()
+
+    def _shelf_written(self, writer: asyncio.Future):
+        self._shelf_writer = None
+        flushed, self.shelf_flushing = self.shelf_flushing, dict()
+        if writer.cancelled() or writer.exception():
+            # Write the batch again with the next
+            # one. Newer changes take precedence.
+            self.shelf_dirty = {**flushed, **self.shelf_dirty}
+
     async def delete(self, key: str):
-        with self as opened:
-            opened.shelf.pop(key, None)
+        self._shelf_mark(str(key), _SHELF_DELETED)
+
+    async def delete_many(self, keys: typing.Iterable[str]):
+        self._shelf_mark_many({str(k): _SHELF_DELETED for k in keys})
+
+    def flush(self):
+        """
+        Write all pending changes to the shelf.
+        """
+
+        if not self.shelf_dirty:
+            return
+
+        # Cleared only once written, so nothing is
+        # lost if writing fails.
+        self._shelf_write(self._shelf_open(), self.shelf_dirty)
+        self.shelf_dirty = dict()
 
     async def locate(
         self,
         *keys: str,
         statement: FilterStatement | None = None) -> Located[str, R]:
 
-        locator = lambda key: self.shelf.get(str(key), None)
-        with self as _:
-            return _locate_any(
-                locator,
-                keys or self.shelf.keys(), #type: ignore
-                statement)
+        def locator(key: str) -> R | None:
+            data = self._shelf_get(str(key))
+            return None if data is None else self._resource_loads(data)
+
+        if not keys:
+            with self._shelf_lock:
+                keys = (*self._shelf_open().keys(), *self.shelf_flushing, *self.shelf_dirty) #type: ignore
+            keys = tuple(dict.fromkeys(keys))
+        return _locate_any(locator, keys, statement) #type: ignore
+
+    async def locate_many(self, keys: typing.Iterable[str]):
+        found = [self._shelf_get(str(k)) for k in keys]
+        return [None if d is None else self._resource_loads(d) for d in found]
+
+    async def modify(self, key: str, resource: R):
+        self._shelf_mark(str(key), self._resource_dumps(resource))
+
+    async def modify_many(self, items: typing.Iterable[LocatedPair[str, R]]):
+        self._shelf_mark_many({str(k): self._resource_dumps(r) for k, r in items})
+
+    async def shutdown(self):
+        if self._shelf_flusher:
+            self._shelf_flusher.cancel()
+            self._shelf_flusher = None
+        if self._shelf_writer:
+            # Let the batch in flight finish before
+            # the shelf is closed under it.
+            await asyncio.wait([self._shelf_writer])
+
+        self.flush()
+        if self.shelf is not None:
+            self.shelf.close()
+            self.shelf = None
+
+    async def startup(self):
+        self._shelf_open()
+        if not self._shelf_flusher:
+            self._shelf_flusher = asyncio.create_task(self._shelf_flush_loop())
+
+
+def cursor_offset(cursor: str | None) -> int:
+    """
+    Decode a cursor given to `Broker.stream`.
+    Raises `ValueError` if the cursor is invalid.
+    """
+
+    if not cursor:
+        return 0
+
+    try:
+        offset = int(base64.urlsafe_b64decode(cursor.encode()).decode())
+    except (ValueError, UnicodeError):
+        raise ValueError(f"invalid cursor: {cursor!r}") from None
+    if offset < 0:
+        raise ValueError(f"invalid cursor: {cursor!r}")
+    return offset
+
+
+def next_cursor(cursor: str | None, limit: int) -> str:
+    """
+    The cursor of the page following the page
+    streamed from `cursor` with `limit`.
+    """
+
+    offset = cursor_offset(cursor) + limit
+    return base64.urlsafe_b64encode(str(offset).encode()).decode()
+
+
+def _scan_cursor(cursor: str | None) -> tuple[int, int]:
+    """
+    Decode a cursor given to `RedisBroker.stream`:
+    the `SCAN` cursor of a batch and how many of
+    its keys were already streamed. Raises
+    `ValueError` if the cursor is invalid.
+    """
+
+    if not cursor:
+        return 0, 0
+
+    try:
+        scan, skip = map(int, base64.urlsafe_b64decode(cursor.encode()).decode().split(":"))
+    except (ValueError, UnicodeError):
+        raise ValueError(f"invalid cursor: {cursor!r}") from None
+    if scan < 0 or skip < 0:
+        raise ValueError(f"invalid cursor: {cursor!r}")
+    return scan, skip
+
+
+def _next_scan_cursor(scan: int, skip: int) -> str:
+    """
+    The cursor resuming a `SCAN` after the first
+    `skip` keys of the batch at `scan`.
+    """
+
+    return base64.urlsafe_b64encode(f"{scan}:{skip}".encode()).decode()
+
+
+def _paginate[T](
+        items: typing.Iterable[T],
+        offset: int,
+        limit: int | None) -> typing.Iterator[T]:
+
+    return itertools.islice(items, offset, None if limit is None else offset + limit)
 
 
 def _locate_any[K: typing.Hashable, R](
@@ -219,6 +1274,6 @@ def _locate_any[K: typing.Hashable, R](
     key(s).
     """
 
-    isvalid = compose_validator(statement) if statement else (lambda _: True)
+    isvalid = compile_statement(statement) if statement else (lambda _: True)
     pred    = lambda found: found[1] is not None and isvalid(found[1])
     return tuple(filter(pred, ((k, locator(k)) for k in keys))) #type: ignore
@@ -1,10 +1,11 @@
-import asyncio
-import time
+import bisect, itertools
 
 from scryer.creatures import Creature
 from scryer.services.brokers import MemoryBroker
 from scryer.util import UUID
 
+type OrderKey = tuple[float, int, UUID]
+
 
 class CreaturesMemoryBroker(MemoryBroker[UUID, Creature]):
     """
@@ -13,25 +14,131 @@ class CreaturesMemoryBroker(MemoryBroker[UUID, Creature]):
 
     This allows for creatures to be stored
     in-memory when persistence is not a priority.
+
+    Creatures are kept in initiative order, highest
+    first. Ties are broken by the order creatures
+    were first added.
+
+    Unless told otherwise, at most 64 callers may
+    wait for room to create a creature.
     """
 
+    creature_order: list[OrderKey]
+    creature_order_keys: dict[UUID, OrderKey]
+    creature_next: dict[UUID, UUID]
+    creature_prev: dict[UUID, UUID]
+
+    _creature_seq: itertools.count
+
+    def __init__(self, *args, max_waiters: int | None = 64, **kwds):
+        super().__init__(*args, max_waiters=max_waiters, **kwds)
+        self.creature_order      = list()
+        self.creature_order_keys = dict()
+        self.creature_next       = dict()
+        self.creature_prev       = dict()
+
+        self._creature_seq = itertools.count()
+
+    def _order_discard(self, key: UUID) -> int | None:
+        """
+        Remove a creature from the initiative
+        order. Returns the tie-break sequence it
+        held, if any.
+        """
+
+        okey = self.creature_order_keys.pop(key, None)
+        if okey is None:
+            return None
+
+        del self.creature_order[bisect.bisect_left(self.creature_order, okey)]
+        before, after = self.creature_prev.pop(key), self.creature_next.pop(key)
+        if before != key:
+            self.creature_next[before] = after
+            self.creature_prev[after] = before
+        return okey[1]
+
+    def _order_insert(self, key: UUID, initiative: float, seq: int):
+        okey  = (-initiative, seq, key)
+        order = self.creature_order
+        index = bisect.bisect_left(order, okey)
+        order.insert(index, okey)
+        self.creature_order_keys[key] = okey
+
+        if len(order) == 1:
+            self.creature_next[key] = self.creature_prev[key] = key
+            return
+
+        # Turns wrap around, so the neighbours of
+        # the ends are each other.
+        before, after = order[index - 1][2], order[(index + 1) % len(order)][2]
+        self.creature_next[before], self.creature_prev[key] = key, before
+        self.creature_next[key], self.creature_prev[after] = after, key
+
+    def _resource_pop(self, key: UUID):
+        self._order_discard(key)
+        return super()._resource_pop(key)
+
+    def _resource_put(self, key: UUID, resource: Creature):
+        okey = self.creature_order_keys.get(key)
+        if okey is None or okey[0] != -resource.initiative:
+            # Creatures keep their place amongst
+            # ties when their initiative changes.
+            seq = self._order_discard(key)
+            if seq is None:
+                seq = next(self._creature_seq)
+            self._order_insert(key, resource.initiative, seq)
+        super()._resource_put(key, resource)
+
+    def next_of(self, key: UUID) -> UUID | None:
+        """
+        The creature whose turn follows the given
+        creature.
+        """
+
+        return self.creature_next.get(key)
+
+    def ordered(self, start: UUID | None = None) -> list[Creature]:
+        """
+        All creatures in initiative order. If
+        `start` is given, the order is rotated to
+        begin at that creature.
+        """
+
+        order = self.creature_order
+        index = 0
+        if start in self.creature_order_keys:
+            index = bisect.bisect_left(order, self.creature_order_keys[start]) #type: ignore
+
+        rmap = self.resource_map
+        return [rmap[k] for _, _, k in itertools.chain(order[index:], order[:index])]
+
+    def previous_of(self, key: UUID) -> UUID | None:
+        """
+        The creature whose turn precedes the given
+        creature.
+        """
+
+        return self.creature_prev.get(key)
+
+    def top(self) -> UUID | None:
+        """
+        The creature with the highest initiative.
+        """
+
+        return self.creature_order[0][2] if self.creature_order else None
+
     async def create(
             self,
             *args,
             timeout: float | None = None,
             **kwds) -> tuple[UUID, Creature]:
 
-        start = time.monotonic()
-        while timeout is not None:
-            if self._capacity_delta > 0:
-                break
-            if time.monotonic() - start >= timeout:
-                raise TimeoutError("waited too long for memory to free.")
-            await asyncio.sleep(0.25)
+        if timeout is not None and not (await self.wait_ready(timeout)):
+            raise TimeoutError("waited too long for memory to free.")
 
         creature = self.resource_cls(*args, **kwds)
-        self.resource_map[creature.creature_uuid] = creature
+        self._resource_put(creature.creature_uuid, creature)
         return (creature.creature_uuid, creature)
 
     async def modify(self, key: UUID, resource: Creature, *args, **kwds):
-        self.resource_map[key] = resource
+        self._resource_put(key, resource)
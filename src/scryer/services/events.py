@@ -1,9 +1,11 @@
-import abc, typing
+import abc, asyncio, collections, itertools, logging, time, typing
 
-from scryer.services.brokers import Broker, MemoryBroker
+from scryer.services.brokers import Broker, Located, MemoryBroker
 from scryer.util import request_uuid, UUID
 from scryer.util.events import Event, EventBody, Message, PartialEvent
 
+logger = logging.getLogger(__name__)
+
 
 class EventBroker(Broker[UUID, Event]):
 
@@ -22,13 +24,126 @@ class EventBroker(Broker[UUID, Event]):
         given session `UUID`.
         """
 
+    async def delete_session(self, session_uuid: UUID):
+        """
+        Delete every event associated with the
+        given session.
+        """
+
+        await self.delete_many(k for k, _ in await self.locate_session(session_uuid))
+
+    async def locate_session(
+            self,
+            session_uuid: UUID,
+            limit: int | None = None) -> Located[UUID, Event]:
+        """
+        Find events associated with the given
+        session, oldest first. If `limit` is given,
+        only the newest `limit` events are
+        returned.
+        """
+
+        found = await self.locate(statement={
+            "logic": "and",
+            "filters": [
+                {
+                    "field": "session_uuid",
+                    "operator": "eq",
+                    "value": session_uuid
+                }
+            ]
+        })
+        return found[-limit:] if limit else found
+
 
 class EventMemoryBroker(EventBroker, MemoryBroker[UUID, Event]):
     """
     Implementation of memory broker which manages
     events at runtime.
+
+    Events are kept in a log per session. Each log
+    is bounded by `max_length` and `max_age`
+    (in seconds); the oldest events are dropped
+    once either bound is exceeded. Logs are swept
+    every `sweep_interval` seconds once started,
+    so logs no longer written to still expire.
     """
 
+    event_logs:           dict[UUID | None, collections.OrderedDict[UUID, float]]
+    event_max_age:        float | None
+    event_max_length:     int | None
+    event_sweep_interval: float
+
+    _sweeper: asyncio.Task | None
+
+    def __init__(
+            self,
+            cls: type[Event],
+            max_size: int | None = None,
+            *,
+            max_length: int | None = None,
+            max_age: float | None = None,
+            sweep_interval: float = 60.0,
+            **kwds):
+
+        super().__init__(cls, max_size, **kwds)
+        self.event_logs           = dict()
+        self.event_max_age        = max_age
+        self.event_max_length     = max_length
+        self.event_sweep_interval = sweep_interval
+
+        self._sweeper = None
+
+    def _log_expire(self, session_uuid: UUID | None):
+        """
+        Drop events from the front of a session log
+        until it is within its bounds.
+        """
+
+        log = self.event_logs.get(session_uuid)
+        if log is None:
+            return
+
+        expires = time.monotonic() - (self.event_max_age or 0)
+        while log:
+            event_uuid, created = next(iter(log.items()))
+            too_long = self.event_max_length and len(log) > self.event_max_length
+            too_old  = self.event_max_age and created < expires
+            if not (too_long or too_old):
+                break
+            log.popitem(last=False)
+            super()._resource_pop(event_uuid)
+
+        if not log:
+            del self.event_logs[session_uuid]
+
+    async def _log_sweep_loop(self):
+        while True:
+            await asyncio.sleep(self.event_sweep_interval)
+            try:
+                self.sweep()
+            except Exception:
+                logger.exception("Failed to sweep event logs")
+
+    def _resource_pop(self, key: UUID):
+        event = self.resource_map.get(key)
+        if event is not None and event.session_uuid in self.event_logs:
+            log = self.event_logs[event.session_uuid]
+            log.pop(key, None)
+            if not log:
+                del self.event_logs[event.session_uuid]
+        return super()._resource_pop(key)
+
+    def _resource_put(self, key: UUID, resource: Event):
+        if key in self.resource_map:
+            self._resource_pop(key)
+        super()._resource_put(key, resource)
+
+        session_uuid = resource.session_uuid
+        self.event_logs.setdefault(session_uuid, collections.OrderedDict())
+        self.event_logs[session_uuid][key] = time.monotonic()
+        self._log_expire(session_uuid)
+
     async def create[B, **P](
             self,
             session_uuid: UUID,
@@ -39,5 +154,46 @@ class EventMemoryBroker(EventBroker, MemoryBroker[UUID, Event]):
 
         event_uuid = request_uuid()
         event = (factory or Message)(body, session_uuid=session_uuid, **kwds) #type: ignore
-        self.resource_map[event_uuid] = event
+        self._resource_put(event_uuid, event)
         return (event_uuid, event)
+
+    async def delete_session(self, session_uuid: UUID):
+        log = self.event_logs.pop(session_uuid, None)
+        for event_uuid in log or ():
+            super()._resource_pop(event_uuid)
+
+    async def locate_session(
+            self,
+            session_uuid: UUID,
+            limit: int | None = None) -> Located[UUID, Event]:
+
+        self._log_expire(session_uuid)
+        log = self.event_logs.get(session_uuid)
+        if not log:
+            return ()
+
+        # Walk the log from the newest end so only
+        # the requested events are visited.
+        keys = list(itertools.islice(reversed(log), limit))[::-1] if limit else list(log)
+        return tuple((k, self.resource_map[k]) for k in keys)
+
+    async def shutdown(self):
+        await super().shutdown()
+        if self._sweeper:
+            self._sweeper.cancel()
+            self._sweeper = None
+
+    async def startup(self):
+        await super().startup()
+        if self.event_max_age and not self._sweeper:
+            self._sweeper = asyncio.create_task(self._log_sweep_loop())
+
+    def sweep(self):
+        """
+        Expire events from every session log,
+        including logs of sessions no longer
+        active.
+        """
+
+        for session_uuid in tuple(self.event_logs):
+            self._log_expire(session_uuid)
@@ -0,0 +1,159 @@
+"""
+Policies deciding which entries a `MemoryBroker`
+drops to stay within its bounds.
+"""
+
+import abc, collections, time, typing
+
+__all__ = ("EvictionPolicy", "LRUPolicy", "SizePolicy", "TTLPolicy")
+
+
+class EvictionPolicy[K: typing.Hashable](abc.ABC):
+    """
+    Tracks the entries of a broker and picks
+    which of them should be evicted.
+    """
+
+    def access(self, key: K):
+        """Record that an entry was read."""
+
+    @abc.abstractmethod
+    def discard(self, key: K):
+        """Forget an entry which left the broker."""
+
+    def expired(self) -> typing.Iterable[K]:
+        """
+        Entries which should be evicted regardless
+        of how full the broker is.
+        """
+
+        return ()
+
+    def overflowing(self) -> bool:
+        """
+        Whether the policy itself requires entries
+        to be evicted, apart from the broker
+        capacity.
+        """
+
+        return False
+
+    @abc.abstractmethod
+    def put(self, key: K, resource: object):
+        """Record that an entry was written."""
+
+    @abc.abstractmethod
+    def victim(self) -> K | None:
+        """The next entry to evict, if any."""
+
+
+class LRUPolicy[K: typing.Hashable](EvictionPolicy[K]):
+    """
+    Evicts the least recently used entries first.
+    """
+
+    policy_order: collections.OrderedDict[K, typing.Any]
+
+    def __init__(self):
+        self.policy_order = collections.OrderedDict()
+
+    def access(self, key: K):
+        if key in self.policy_order:
+            self.policy_order.move_to_end(key)
+
+    def discard(self, key: K):
+        self.policy_order.pop(key, None)
+
+    def put(self, key: K, resource: object):
+        self.policy_order[key] = None
+        self.policy_order.move_to_end(key)
+
+    def victim(self) -> K | None:
+        return next(iter(self.policy_order), None)
+
+
+class SizePolicy[K: typing.Hashable](LRUPolicy[K]):
+    """
+    Evicts the least recently used entries while
+    the total size of all entries exceeds
+    `max_bytes`. Sizes are measured by `sizeof`
+    when an entry is written. It must count what
+    the entry refers to, not only the entry
+    itself as `sys.getsizeof` does.
+    """
+
+    policy_max_bytes: int
+    policy_sizeof:    typing.Callable[[typing.Any], int]
+    policy_total:     int
+
+    def __init__(
+            self,
+            max_bytes: int,
+            *,
+            sizeof: typing.Callable[[typing.Any], int]):
+
+        super().__init__()
+        self.policy_max_bytes = max_bytes
+        self.policy_sizeof    = sizeof
+        self.policy_total     = 0
+
+    def discard(self, key: K):
+        self.policy_total -= self.policy_order.pop(key, 0)
+
+    def overflowing(self) -> bool:
+        return self.policy_total > self.policy_max_bytes
+
+    def put(self, key: K, resource: object):
+        self.discard(key)
+        size = self.policy_sizeof(resource)
+        self.policy_order[key] = size
+        self.policy_total += size
+
+
+class TTLPolicy[K: typing.Hashable](EvictionPolicy[K]):
+    """
+    Evicts entries `ttl` seconds after they were
+    last written. If `sliding`, reading an entry
+    also pushes its expiry back.
+
+    When the broker is full, the entry closest to
+    expiring is evicted first.
+    """
+
+    policy_expiry:  collections.OrderedDict[K, float]
+    policy_sliding: bool
+    policy_ttl:     float
+
+    def __init__(self, ttl: float, *, sliding: bool = True):
+        self.policy_expiry  = collections.OrderedDict()
+        self.policy_sliding = sliding
+        self.policy_ttl     = ttl
+
+    def access(self, key: K):
+        if self.policy_sliding and key in self.policy_expiry:
+            self._expiry_set(key)
+
+    def discard(self, key: K):
+        self.policy_expiry.pop(key, None)
+
+    def _expiry_set(self, key: K):
+        # Every entry lives for the same ttl, so
+        # moving refreshed entries to the end keeps
+        # the map ordered by expiry.
+        self.policy_expiry[key] = time.monotonic() + self.policy_ttl
+        self.policy_expiry.move_to_end(key)
+
+    def expired(self) -> typing.Iterable[K]:
+        now = time.monotonic()
+        found = []
+        for key, expires in self.policy_expiry.items():
+            if expires > now:
+                break
+            found.append(key)
+        return found
+
+    def put(self, key: K, resource: object):
+        self._expiry_set(key)
+
+    def victim(self) -> K | None:
+        return next(iter(self.policy_expiry), None)
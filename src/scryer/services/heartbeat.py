@@ -0,0 +1,220 @@
+"""
+Heartbeats sent to client connections. Measures
+round trip latency to each client, and reaps
+connections which stopped answering.
+"""
+
+import asyncio, collections, contextlib, itertools, logging, statistics, time, typing
+
+from fastapi import WebSocket
+from fastapi.websockets import WebSocketState
+
+from scryer.services.brokers import MemoryBroker
+from scryer.services.outbox import outbox_detach
+from scryer.services.service import Service, ServiceStatus
+from scryer.services.sessions import send_event_action
+from scryer.services.sockets import SessionSocket, SocketBroker
+from scryer.util import UUID
+from scryer.util.events import HeartbeatPing, Ping
+
+__all__ = ("Heartbeat", "HeartbeatState", "heartbeat_of")
+
+logger = logging.getLogger(__name__)
+
+WS_GOING_AWAY = 1001
+"""Close code sent to clients which are reaped."""
+
+
+class HeartbeatState:
+    """
+    Heartbeat bookkeeping of a single client
+    connection.
+    """
+
+    missed:  int
+    """Pings sent since the last answered."""
+    pending: dict[int, float]
+    """When each unanswered ping was sent."""
+    rtt:     float | None
+    """Latest round trip time, in seconds."""
+
+    def __init__(self):
+        self.missed  = 0
+        self.pending = dict()
+        self.rtt     = None
+
+    def ping(self, nonce: int, sent: float, keep: int):
+        """Record a ping sent to the client."""
+
+        self.missed += 1
+        self.pending[nonce] = sent
+        while len(self.pending) > keep:
+            self.pending.pop(next(iter(self.pending)))
+
+    def pong(self, nonce: int, received: float) -> bool:
+        """
+        Record the client answering a ping. Returns
+        whether the ping was one still pending.
+        """
+
+        sent = self.pending.pop(nonce, None)
+        if sent is None:
+            return False
+
+        # Answering any ping proves the connection
+        # is alive, including pings sent earlier.
+        self.missed = 0
+        self.pending = {n: s for n, s in self.pending.items() if n > nonce}
+        self.rtt = received - sent
+        return True
+
+
+class Heartbeat(Service):
+    """
+    Pings every connection brokered by `clients`
+    each `interval` seconds. Connections which
+    miss `max_missed` pings in a row are dropped
+    from the broker and closed, so broadcasts only
+    go to live clients.
+    """
+
+    clients:              SocketBroker
+    heartbeat_interval:   float
+    heartbeat_max_missed: int
+    heartbeat_stats:      collections.Counter[str]
+
+    _closers: set[asyncio.Task]
+    _nonce:   itertools.count
+    _runner:  asyncio.Task | None
+
+    def __init__(
+            self,
+            clients: SocketBroker,
+            *,
+            interval: float = 15.0,
+            max_missed: int = 3):
+
+        self.clients              = clients
+        self.heartbeat_interval   = interval
+        self.heartbeat_max_missed = max_missed
+        self.heartbeat_stats      = collections.Counter()
+
+        self._closers = set()
+        self._nonce   = itertools.count(1)
+        self._runner  = None
+
+    @property
+    def status(self):
+        if self._runner is None or self._runner.done():
+            return ServiceStatus.OFFLINE
+        return ServiceStatus.ONLINE
+
+    @property
+    def stats(self) -> dict[str, typing.Any]:
+        """
+        Heartbeat counters, and the latest round
+        trip time to each client in milliseconds.
+        """
+
+        states = [
+            (c, state) for c in self._connections()
+            if (state := heartbeat_of(c)) is not None
+        ]
+        rtts = [round(s.rtt * 1000, 3) for _, s in states if s.rtt is not None]
+
+        return {
+            "pings": self.heartbeat_stats["pings"],
+            "pongs": self.heartbeat_stats["pongs"],
+            "reaped": self.heartbeat_stats["reaped"],
+            "rtt_ms_median": statistics.median(rtts) if rtts else None,
+            "rtt_ms_max": max(rtts, default=None),
+            "clients": [
+                {
+                    "client_uuid": str(c.cookies.get("client_uuid")),
+                    "session_uuid": str(c.cookies.get("session_uuid")),
+                    "rtt_ms": None if s.rtt is None else round(s.rtt * 1000, 3),
+                    "missed": s.missed
+                }
+                for c, s in states
+            ]
+        }
+
+    def _connections(self) -> list[SessionSocket]:
+        # Iterating the broker does not count as
+        # lookups in its own stats.
+        if isinstance(self.clients, MemoryBroker):
+            return list(self.clients)
+        return []
+
+    async def _close(self, client: SessionSocket):
+        with contextlib.suppress(Exception):
+            await client.close(WS_GOING_AWAY)
+
+    async def _reap(self, client_uuid: UUID, client: SessionSocket):
+        self.heartbeat_stats["reaped"] += 1
+        await self.clients.delete(client_uuid)
+        await outbox_detach(client)
+        if client.client_state is WebSocketState.DISCONNECTED:
+            return
+
+        # Closing a dead connection can take until
+        # the transport times out. Do not hold up
+        # the rest of the sweep.
+        closer = asyncio.create_task(self._close(client))
+        self._closers.add(closer)
+        closer.add_done_callback(self._closers.discard)
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            try:
+                await self.sweep()
+            except Exception:
+                logger.exception("Failed to sweep heartbeats")
+
+    def pong(self, client: WebSocket, body: typing.Mapping[str, typing.Any]):
+        """Record a client answering a ping."""
+
+        state = heartbeat_of(client)
+        if state is None or not isinstance(body.get("nonce"), int):
+            return
+        if state.pong(body["nonce"], time.monotonic()):
+            self.heartbeat_stats["pongs"] += 1
+
+    async def shutdown(self):
+        if self._runner:
+            self._runner.cancel()
+            self._runner = None
+        for closer in tuple(self._closers):
+            closer.cancel()
+
+    async def startup(self):
+        if not self._runner:
+            self._runner = asyncio.create_task(self._run())
+
+    async def sweep(self):
+        """
+        Reap connections which are closed or missed
+        too many pings, then ping the rest.
+        """
+
+        for client_uuid, client in await self.clients.locate():
+            state = heartbeat_of(client)
+            if state is None:
+                state = client.state.heartbeat = HeartbeatState()
+
+            dead = client.client_state is WebSocketState.DISCONNECTED
+            if dead or state.missed >= self.heartbeat_max_missed:
+                await self._reap(client_uuid, client)
+                continue
+
+            nonce = next(self._nonce)
+            state.ping(nonce, time.monotonic(), self.heartbeat_max_missed)
+            await send_event_action(client, Ping(HeartbeatPing(nonce=nonce)))
+            self.heartbeat_stats["pings"] += 1
+
+
+def heartbeat_of(sock: WebSocket) -> HeartbeatState | None:
+    """The heartbeat state of a connection, if any."""
+
+    return getattr(sock.state, "heartbeat", None)
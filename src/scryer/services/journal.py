@@ -0,0 +1,276 @@
+"""
+Append-only journal of session mutations. Used to
+recover sessions after the application restarts.
+"""
+
+import asyncio, json, logging, os, pathlib, typing
+
+from scryer.services.events import EventBroker
+from scryer.services.sessions import CombatSession, SessionMapping
+from scryer.services.sockets import SocketBroker
+from scryer.util import UUID, request_uuid
+
+__all__ = ("JOURNAL_SCHEMA_VERSION", "SessionJournal")
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_SCHEMA_VERSION = 1
+"""
+Version of the snapshot layout written by
+`SessionJournal.compact`.
+"""
+
+type JournalRecord = dict[str, typing.Any]
+
+
+class SessionJournal:
+    """
+    Records every mutation of attached sessions to
+    an append-only log on disk. Every
+    `snapshot_every` records the log is compacted
+    into a snapshot of all attached sessions. The
+    log is swapped for a new one first, and the
+    snapshot is written in a thread so the event
+    loop is not held up.
+
+    Sessions are restored by loading the latest
+    snapshot, then replaying the logs written after
+    it.
+    """
+
+    journal_path:     pathlib.Path
+    journal_sessions: dict[UUID, CombatSession]
+    snapshot_every:   int
+
+    _compactor:   asyncio.Task | None
+    _log:         typing.TextIO | None
+    _log_records: int
+
+    def __init__(self, path: str | os.PathLike, *, snapshot_every: int = 1000):
+        self.journal_path     = pathlib.Path(path)
+        self.journal_sessions = dict()
+        self.snapshot_every   = snapshot_every
+
+        self._compactor   = None
+        self._log         = None
+        self._log_records = 0
+
+    @property
+    def log_path(self) -> pathlib.Path:
+        return self.journal_path / "journal.log"
+
+    @property
+    def log_rotated_path(self) -> pathlib.Path:
+        return self.journal_path / "journal.log.1"
+
+    @property
+    def snapshot_path(self) -> pathlib.Path:
+        return self.journal_path / "snapshot.json"
+
+    def _append(self, record: JournalRecord):
+        # Records are only written once the
+        # journal has been opened. Otherwise a
+        # compaction could overwrite a snapshot
+        # which was never restored.
+        if self._log is None:
+            return
+
+        self._log.write(json.dumps(record, separators=(",", ":")))
+        self._log.write("\n")
+        self._log.flush()
+
+        self._log_records += 1
+        if self._log_records >= self.snapshot_every:
+            self._compact_later()
+
+    def _compact_later(self):
+        if self._compactor is not None and not self._compactor.done():
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            self.compact()
+            return
+
+        # Records appended from here on go to a new
+        # log, which is replayed after the snapshot.
+        self._rotate()
+        self._compactor = asyncio.create_task(
+            asyncio.to_thread(self._write_snapshot, self._snapshot()))
+        self._compactor.add_done_callback(self._compacted)
+
+    def _compacted(self, task: asyncio.Task):
+        if task.cancelled() or not (error := task.exception()):
+            return
+
+        logger.error("Failed to compact the journal", exc_info=error)
+        # The rotated log is still on disk and is
+        # replayed on restore. Try again with the
+        # next record; it is folded into the
+        # rotated log first.
+        self._log_records = max(self._log_records, self.snapshot_every)
+
+    def _rotate(self):
+        if self._log is None:
+            self._log_records = 0
+            return
+
+        self._log.close()
+        if self.log_rotated_path.exists():
+            # An earlier compaction did not finish.
+            # Its records are still needed.
+            with self.log_rotated_path.open("a") as fd:
+                fd.write(self.log_path.read_text())
+            self.log_path.unlink()
+        else:
+            os.replace(self.log_path, self.log_rotated_path)
+        self._log = self.log_path.open("w")
+        self._log_records = 0
+
+    def _snapshot(self) -> dict[str, typing.Any]:
+        return {
+            "v": JOURNAL_SCHEMA_VERSION,
+            "sessions": [s.into_mapping() for s in self.journal_sessions.values()]
+        }
+
+    def _write_snapshot(self, snapshot: dict[str, typing.Any]):
+        # Replace the snapshot atomically so a
+        # crash never leaves a partial snapshot.
+        self.journal_path.mkdir(parents=True, exist_ok=True)
+        staging = self.snapshot_path.with_suffix(".tmp")
+        with staging.open("w") as fd:
+            json.dump(snapshot, fd, separators=(",", ":"))
+            fd.flush()
+            os.fsync(fd.fileno())
+        os.replace(staging, self.snapshot_path)
+
+        # Replaying records over a newer snapshot
+        # is harmless, so a crash before this
+        # does not lose state.
+        self.log_rotated_path.unlink(missing_ok=True)
+
+    def _session_changed(
+            self,
+            session: CombatSession,
+            op: str,
+            data: dict[str, typing.Any]):
+
+        if self.journal_sessions.get(session.session_uuid) is not session:
+            return
+        self._append({"op": op, "s": str(session.session_uuid), **data})
+
+    def attach(self, session: CombatSession, *, record: bool = True):
+        """
+        Start journaling mutations of a session. If
+        `record` is set, the current state of the
+        session is written to the log.
+        """
+
+        if self.journal_sessions.get(session.session_uuid) is not session:
+            self.journal_sessions[session.session_uuid] = session
+            session.observe(self._session_changed)
+
+        if record:
+            self._append({
+                "op": "session_put",
+                "s": str(session.session_uuid),
+                "session": session.into_mapping()
+            })
+
+    async def close(self):
+        """
+        Compact the journal and close the log.
+        """
+
+        if self._compactor is not None:
+            await asyncio.gather(self._compactor, return_exceptions=True)
+            self._compactor = None
+        if self._log is None:
+            return
+
+        self.compact()
+        self._log.close()
+        self._log = None
+
+    def compact(self):
+        """
+        Write a snapshot of all attached sessions,
+        then truncate the logs.
+        """
+
+        self._rotate()
+        self._write_snapshot(self._snapshot())
+
+    def detach(self, session: CombatSession):
+        """
+        Stop journaling a session and record that
+        it was removed.
+        """
+
+        if self.journal_sessions.get(session.session_uuid) is not session:
+            return
+
+        del self.journal_sessions[session.session_uuid]
+        self._append({"op": "session_pop", "s": str(session.session_uuid)})
+
+    def open(self):
+        """Open the log for appending."""
+
+        if self._log is not None:
+            return
+
+        self.journal_path.mkdir(parents=True, exist_ok=True)
+        self._log = self.log_path.open("a")
+
+    def restore(
+            self,
+            client_broker: SocketBroker,
+            event_broker: EventBroker,
+            cls: type[CombatSession] = CombatSession) -> list[CombatSession]:
+        """
+        Rebuild sessions from the latest snapshot
+        and the log written after it.
+        """
+
+        mappings: list[SessionMapping] = []
+        if self.snapshot_path.exists():
+            snapshot = json.loads(self.snapshot_path.read_text())
+            version  = snapshot.get("v")
+            if version != JOURNAL_SCHEMA_VERSION:
+                raise ValueError(f"unsupported journal schema version: {version!r}")
+            mappings = snapshot["sessions"]
+
+        sessions: dict[UUID, CombatSession] = {}
+        for mapping in mappings:
+            session = cls.from_mapping(mapping, client_broker, event_broker)
+            sessions[session.session_uuid] = session
+
+        # A log left rotated by a compaction which
+        # did not finish comes before the current.
+        records = 0
+        for log_path in (self.log_rotated_path, self.log_path):
+            if not log_path.exists():
+                continue
+            with log_path.open() as fd:
+                for line in fd:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # A torn write at the tail of
+                        # the log. Nothing follows it.
+                        break
+
+                    records += 1
+                    op, session_uuid = record.pop("op"), request_uuid(record.pop("s"))
+                    if op == "session_put":
+                        sessions[session_uuid] = cls.from_mapping(
+                            record["session"],
+                            client_broker,
+                            event_broker)
+                    elif op == "session_pop":
+                        sessions.pop(session_uuid, None)
+                    elif session_uuid in sessions:
+                        sessions[session_uuid].apply(op, record)
+
+        self._log_records = records
+        return list(sessions.values())
@@ -0,0 +1,268 @@
+"""
+Bounded outbound queues for client connections.
+Events are queued without waiting on the client,
+then written by a task owned by each connection.
+"""
+
+import asyncio, collections, contextlib, enum, typing
+
+from fastapi import WebSocket
+from fastapi.websockets import WebSocketState
+
+from scryer.util.events import Event, EventType
+from scryer.util.wire import wire_format_of
+
+__all__ = (
+    "OUTBOX_CRITICAL",
+    "Outbox",
+    "OverflowPolicy",
+    "outbox_attach",
+    "outbox_detach",
+    "outbox_of"
+)
+
+OUTBOX_CRITICAL = frozenset({
+    EventType.END_SESSION,
+    EventType.JOIN_SESSION,
+    EventType.RECEIVE_CLIENT_UUID,
+    EventType.RECEIVE_MESSAGE,
+    EventType.RECEIVE_ROLL,
+    EventType.REQUEST_ROLL,
+    EventType.RPC_RESPONSE
+})
+"""
+Events which are never dropped from an outbox.
+Anything else can be recovered by the client
+fetching the latest state.
+"""
+
+WS_TRY_AGAIN_LATER = 1013
+"""Close code sent to clients which fell behind."""
+
+
+class OverflowPolicy(enum.StrEnum):
+    """
+    What an `Outbox` does when an event is queued
+    while it is full.
+    """
+
+    COALESCE    = enum.auto()
+    """
+    Replace queued events of the same type,
+    otherwise drop the oldest droppable event.
+    """
+    DISCONNECT  = enum.auto()
+    """Close the connection."""
+    DROP_OLDEST = enum.auto()
+    """Drop the oldest droppable event."""
+
+
+class OutboxEntry(typing.NamedTuple):
+    event_type: EventType | None
+    data:       str | bytes
+    critical:   bool
+
+
+class Outbox:
+    """
+    Queue of events waiting to be written to a
+    single client connection. A slow client only
+    fills its own queue, so queueing never waits
+    on the client.
+
+    Critical events are never dropped. If the
+    queue is full of them, the client is
+    disconnected instead.
+    """
+
+    outbox_maxlen: int
+    outbox_policy: OverflowPolicy
+    outbox_queue:  collections.deque[OutboxEntry]
+    outbox_stats:  collections.Counter[str]
+    sock:          WebSocket
+
+    _closer: asyncio.Task | None
+    _closed: bool
+    _ready:  asyncio.Event
+    _writer: asyncio.Task | None
+
+    def __init__(
+            self,
+            sock: WebSocket,
+            *,
+            maxlen: int = 64,
+            policy: OverflowPolicy = OverflowPolicy.COALESCE):
+
+        self.outbox_maxlen = maxlen
+        self.outbox_policy = policy
+        self.outbox_queue  = collections.deque()
+        self.outbox_stats  = collections.Counter()
+        self.sock          = sock
+
+        self._closer = None
+        self._closed = False
+        self._ready  = asyncio.Event()
+        self._writer = None
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def _drop_oldest(self) -> bool:
+        for idx, entry in enumerate(self.outbox_queue):
+            if not entry.critical:
+                del self.outbox_queue[idx]
+                self.outbox_stats["dropped"] += 1
+                return True
+        return False
+
+    def _coalesce(self, entry: OutboxEntry) -> bool:
+        # The newest event of a type supersedes any
+        # of that type still queued.
+        queue = self.outbox_queue
+        kept  = [q for q in queue if q.critical or q.event_type != entry.event_type]
+
+        coalesced = len(queue) - len(kept)
+        if coalesced:
+            queue.clear()
+            queue.extend(kept)
+        self.outbox_stats["coalesced"] += coalesced
+        return coalesced > 0
+
+    def _make_room(self, entry: OutboxEntry) -> bool:
+        """
+        Make room for an entry in a full queue.
+        Returns whether the entry can be queued.
+        """
+
+        if self.outbox_policy is not OverflowPolicy.DISCONNECT:
+            if self._drop_oldest():
+                return True
+            if not entry.critical:
+                # Nothing older can be dropped, so the
+                # new entry is dropped instead.
+                self.outbox_stats["dropped"] += 1
+                return False
+
+        self.disconnect()
+        return False
+
+    async def _write_loop(self):
+        sock  = self.sock
+        queue = self.outbox_queue
+        while True:
+            while not queue:
+                if self._closed:
+                    return
+                self._ready.clear()
+                await self._ready.wait()
+
+            entry = queue.popleft()
+            try:
+                if isinstance(entry.data, bytes):
+                    await sock.send_bytes(entry.data)
+                else:
+                    await sock.send_text(entry.data)
+            except Exception:
+                # The receive loop of the connection
+                # notices the disconnect and cleans up.
+                self._closed = True
+                queue.clear()
+                return
+            self.outbox_stats["sent"] += 1
+
+    async def close(self, timeout: float = 1.0):
+        """
+        Stop accepting events, then wait up to
+        `timeout` seconds for queued events to be
+        written.
+        """
+
+        self._closed = True
+        self._ready.set()
+        if self._writer is None:
+            return
+
+        writer, self._writer = self._writer, None
+        if self.sock.client_state is WebSocketState.DISCONNECTED:
+            # Nothing more can be written.
+            writer.cancel()
+            return
+
+        done, _ = await asyncio.wait((writer,), timeout=timeout)
+        if not done:
+            writer.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await writer
+
+    def disconnect(self):
+        """
+        Drop all queued events and close the
+        connection.
+        """
+
+        self._closed = True
+        self.outbox_queue.clear()
+        self._ready.set()
+        self.outbox_stats["disconnected"] += 1
+        if self.sock.client_state is not WebSocketState.DISCONNECTED:
+            self._closer = asyncio.create_task(self.sock.close(WS_TRY_AGAIN_LATER))
+
+    def put(self, event: Event) -> int:
+        """
+        Queue an event to be written. Returns the
+        number of bytes queued.
+        """
+
+        if self._closed:
+            return 0
+
+        data, size = event.encoded_as(wire_format_of(self.sock))
+        entry = OutboxEntry(event.event_type, data, event.event_type in OUTBOX_CRITICAL)
+        if len(self.outbox_queue) >= self.outbox_maxlen:
+            coalesce = self.outbox_policy is OverflowPolicy.COALESCE and not entry.critical
+            if not (coalesce and self._coalesce(entry)) and not self._make_room(entry):
+                return 0
+
+        self.outbox_queue.append(entry)
+        self._ready.set()
+        return size
+
+    def start(self):
+        """Start writing queued events."""
+
+        if self._writer is None and not self._closed:
+            self._writer = asyncio.create_task(self._write_loop())
+
+
+def outbox_attach(sock: WebSocket, **kwds) -> Outbox:
+    """
+    Create and start the outbox of a connection,
+    unless it already has an open one.
+    """
+
+    outbox = outbox_of(sock)
+    if outbox is not None and not outbox.closed:
+        return outbox
+
+    outbox = Outbox(sock, **kwds)
+    sock.state.outbox = outbox
+    outbox.start()
+    return outbox
+
+
+async def outbox_detach(sock: WebSocket):
+    """Close the outbox of a connection, if any."""
+
+    outbox = outbox_of(sock)
+    if outbox is None:
+        return
+
+    del sock.state.outbox
+    await outbox.close()
+
+
+def outbox_of(sock: WebSocket) -> Outbox | None:
+    """The outbox of a connection, if any."""
+
+    return getattr(sock.state, "outbox", None)
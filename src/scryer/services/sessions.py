@@ -1,8 +1,8 @@
 
-import abc, asyncio, functools, json, typing, uuid
+import abc, asyncio, functools, json, secrets, typing, uuid
 from typing import Any, Mapping
 
-from fastapi import WebSocket
+from fastapi import WebSocket, WebSocketDisconnect
 from fastapi.websockets import WebSocketState
 from pydantic import BaseModel
 from starlette.datastructures import QueryParams
@@ -16,19 +16,35 @@ from scryer.services import (
     ShelfBroker
 )
 from scryer.services.creatures import CreaturesMemoryBroker
+from scryer.services.outbox import (
+    OverflowPolicy,
+    outbox_attach,
+    outbox_detach,
+    outbox_of
+)
 from scryer.services.service import Service, ServiceStatus
 from scryer.services.sockets import SessionSocket, SocketBroker
 from scryer.util import UUID, request_uuid
 from scryer.util.events import (
     Event,
     EventBody,
+    OrderUpdate,
+    ReceiveOrderUpdate,
     ReceiveRoll,
-    SessionJoinBody,
-    dump_event
+    RpcCall,
+    SessionJoinBody
 )
 from scryer.util.filters import FilterStatement, LogicalOp
 from scryer.util.monster import CustomMonster, CustomMonsterMemoryBroker
 from scryer.util.session_group import SessionGroup, SessionGroupMemoryBroker
+from scryer.util.wire import (
+    WireFormat,
+    wire_decoder,
+    wire_format_of
+)
+
+if typing.TYPE_CHECKING:
+    from scryer.services.journal import SessionJournal
 
 # Special types used only in `Session` specific
 # implementations.
@@ -45,12 +61,47 @@ An invokable action which modifies a client
 connection.
 """
 
+SESSION_SCHEMA_VERSION = 1
+"""
+Version of the mapping layout produced by
+`CombatSession.into_mapping`. Must be bumped
+whenever that layout changes.
+"""
+
+WS_MALFORMED_EVENT = 1007
+"""Close code sent to clients which sent an invalid frame."""
+
+type SessionMapping = dict[str, typing.Any]
+"""
+JSON serializable representation of a session.
+"""
+
+type SessionListener = typing.Callable[["CombatSession", str, dict[str, typing.Any]], None]
+"""
+Callback notified of each mutation to a session.
+Passed the session, the name of the mutation and
+its JSON serializable details.
+"""
+
+
 class SessionApi(BaseModel):
     session_uuid: UUID
     session_name: str
     session_description: str
 
 
+class SessionBatch(BaseModel):
+    """
+    Operations applied to a session in order,
+    each naming a socket RPC method. Unless
+    `stop_on_error` is unset, operations after a
+    failed one are skipped.
+    """
+
+    operations:    list[RpcCall]
+    stop_on_error: bool = True
+
+
 def event_action[**P](action: Action[P]) -> Action[P]:
     """
     Wrap or decorate an action to only run if the
@@ -106,12 +157,23 @@ def roled_action[**P]( #type: ignore
 async def send_event_action(sock: WebSocket, event: Event) -> ActionResult:
     """
     Generic action which sends an event to a
-    client connection
+    client connection. Connections with an outbox
+    have the event queued instead, so slow
+    clients never hold up the sender.
     """
 
-    dump = dump_event(event)
-    await sock.send_json(dump)
-    return sock, len(dump)
+    outbox = outbox_of(sock)
+    if outbox is not None:
+        return sock, outbox.put(event)
+
+    # Encodings are cached on the event, so a
+    # broadcast only encodes it once per format.
+    data, size = event.encoded_as(wire_format_of(sock))
+    if isinstance(data, bytes):
+        await sock.send_bytes(data)
+    else:
+        await sock.send_text(data)
+    return sock, size
 
 @event_action
 async def all_send_event_action(
@@ -158,6 +220,36 @@ async def pc_observer_send_event_action(
     return (await send_event_action(sock, event))
 
 
+async def receive_event_data(sock: WebSocket) -> dict[str, typing.Any]:
+    """
+    Receive an event from a client connection.
+    Text frames are always `JSON`. Binary frames
+    use the wire format the client negotiated.
+
+    A frame which does not decode to an event
+    closes the connection, then raises
+    `WebSocketDisconnect` as if the client had
+    left.
+    """
+
+    message = await sock.receive()
+    if message["type"] == "websocket.disconnect":
+        raise WebSocketDisconnect(message.get("code", 1000))
+
+    try:
+        if message.get("bytes") is not None:
+            fmt  = wire_format_of(sock)
+            data = (json.loads if fmt is WireFormat.JSON else wire_decoder(fmt))(message["bytes"])
+        else:
+            data = json.loads(message["text"])
+    except ValueError:
+        data = None
+
+    if not isinstance(data, dict):
+        await sock.close(WS_MALFORMED_EVENT, "Malformed event")
+        raise WebSocketDisconnect(WS_MALFORMED_EVENT)
+    return data
+
 
 class Session[C: SessionSocket](Service):
     """
@@ -169,6 +261,11 @@ class Session[C: SessionSocket](Service):
     # unique. Much like a mathematical set.
     _clients: SocketBroker
 
+    outbox_maxlen: typing.ClassVar[int] = 64
+    """Most events queued for a single client."""
+    outbox_policy: typing.ClassVar[OverflowPolicy] = OverflowPolicy.COALESCE
+    """What to do when a client's queue is full."""
+
     @classmethod
     @abc.abstractmethod
     def new_instance(
@@ -176,8 +273,13 @@ class Session[C: SessionSocket](Service):
             name: str,
             client_broker: SocketBroker,
             event_broker: EventBroker,
-            description: str | None = None) -> typing.Self:
-        """Creates a new session instance."""
+            description: str | None = None,
+            *,
+            session_uuid: UUID | None = None) -> typing.Self:
+        """
+        Creates a new session instance. A new
+        `session_uuid` is made if none is given.
+        """
 
     
     @property 
@@ -214,6 +316,17 @@ class Session[C: SessionSocket](Service):
         client_uuid = request_uuid(body['client_uuid'])
         found = await self.clients.locate(client_uuid)
 
+        # Storing in extra information in cookies 
+        # as a mutable mapping for future 
+        # validation and lookup. This must happen
+        # before the client is brokered so any
+        # indexes on these fields are accurate.
+        client.cookies["client_uuid"]  = client_uuid
+        client.cookies["session_uuid"] = self.session_uuid
+        client.cookies["name"] = body['name']
+        client.cookies["role"] = body['role']
+        outbox_attach(client, maxlen=self.outbox_maxlen, policy=self.outbox_policy)
+
         if client_uuid and found:
             # Throw out the old client and replace 
             # it with the new client. 
@@ -222,16 +335,8 @@ class Session[C: SessionSocket](Service):
         else:
             #Create a new client if no existing 
             # client uuid is found.
-            client.cookies["client_uuid"]  = client_uuid
             client_uuid = (await self.clients.create(client))[0]  
 
-        # Storing in extra information in cookies 
-        # as a mutable mapping for future 
-        # validation and lookup.
-        client.cookies["session_uuid"] = self.session_uuid
-        client.cookies["name"] = body['name']
-        client.cookies["role"] = body['role']
-
         return client_uuid
 
     # TODO: Find different verboge for filtered
@@ -245,7 +350,7 @@ class Session[C: SessionSocket](Service):
         client.
         """
 
-        found = await self.clients.locate(statement=_filter_statement_client(self)) # type: ignore
+        found = await self.clients.locate_session(self.session_uuid)
 
         async with asyncio.TaskGroup() as tg:
             results = [
@@ -261,7 +366,7 @@ class Session[C: SessionSocket](Service):
         required cleanup.
         """
 
-        found = await self.clients.locate(statement=_filter_statement_client(self)) #type: ignore
+        found = await self.clients.locate_session(self.session_uuid)
 
         async with asyncio.TaskGroup() as tg:
             [
@@ -272,13 +377,24 @@ class Session[C: SessionSocket](Service):
     async def detach_client(self, client: C):
         """Disconnect a client."""
 
-        found = await self.clients.locate(statement=_filter_statement_client(self)) #type: ignore
-        client_uuids = [cuid for cuid, c in found if c is client]
-        if not client_uuids:
+        # Clients are brokered under their client
+        # UUID, so the lookup does not need to
+        # scan the session's other connections.
+        client_uuid = client.cookies.get("client_uuid")
+        if not client_uuid:
             return
 
-        await self.clients.delete(client_uuids[0])
-        if client.client_state is WebSocketState.DISCONNECTED:
+        found = await self.clients.locate(client_uuid)
+        if not found or found[0][1] is not client:
+            return
+
+        await self.clients.delete(client_uuid)
+
+        # Flush what is already queued, such as an
+        # `EndSession` event, before closing.
+        await outbox_detach(client)
+        if WebSocketState.DISCONNECTED in (client.client_state, client.application_state):
+            # Closed by either end already.
             return
         await client.close()
 
@@ -306,32 +422,6 @@ class Session[C: SessionSocket](Service):
             return ret
 
 
-def _filter_statement_client[C: SessionSocket](session: Session[C]):
-    return {
-            "logic": "and",
-            "filters": [
-                {
-                    "field": "cookies.session_uuid",
-                    "operator": "eq",
-                    "value": session.session_uuid
-                }
-            ]
-        }
-
-
-def _filter_statement_event[C: SessionSocket](session: Session[C]):
-    return {
-            "logic": "and",
-            "filters": [
-                {
-                    "field": "session_uuid",
-                    "operator": "eq",
-                    "value": session.session_uuid
-                }
-            ]
-        }
-
-
 class CombatSession[C: SessionSocket](Session[C]):
     _session_uuid:        UUID
     _session_name:        str | None
@@ -339,9 +429,24 @@ class CombatSession[C: SessionSocket](Session[C]):
     _session_current_character: UUID | None
 
     _groups:              Broker[UUID, SessionGroup]
-    _characters:          Broker[UUID, Creature]
+    _characters:          CreaturesMemoryBroker
     _custom_monsters:     Broker[str, CustomMonster]
-    _events:              Broker[UUID, Event]
+    _events:              EventBroker
+    _listeners:           list[SessionListener]
+    _lock:                asyncio.Lock
+    _order_actions:       list[Action]
+    _order_flush:         asyncio.Task | None
+    _order_known:         set[UUID]
+    _order_pending:       set[UUID]
+    _order_version:       int
+    _state_epoch:         str
+    _state_version:       int
+
+    order_update_window: typing.ClassVar[float] = 0.05
+    """
+    Seconds to wait for further changes before
+    sending a scheduled order update.
+    """
 
     @classmethod
     def new_instance(
@@ -350,19 +455,75 @@ class CombatSession[C: SessionSocket](Session[C]):
             client_broker: SocketBroker,
             event_broker: EventBroker,
             description: str | None = None,
-            current_character: UUID | None = None) -> typing.Self:
+            current_character: UUID | None = None,
+            session_uuid: UUID | None = None) -> typing.Self:
 
         inst = cls()
         inst._session_description = description
-        inst._session_uuid = request_uuid()
+        inst._session_uuid = session_uuid or request_uuid()
         inst._session_name = name
         inst._session_current_character = current_character
 
         inst._clients         = client_broker
         inst._groups          = SessionGroupMemoryBroker(SessionGroup)
-        inst._characters      = CreaturesMemoryBroker(CharacterV2)
+        inst._characters      = CreaturesMemoryBroker(
+            CharacterV2,
+            indexes=("name", "role"))
         inst._custom_monsters = CustomMonsterMemoryBroker(CustomMonster)
         inst._events          = event_broker
+        inst._listeners       = list()
+        inst._lock            = asyncio.Lock()
+        inst._order_actions   = list()
+        inst._order_flush     = None
+        inst._order_known     = set()
+        inst._order_pending   = set()
+        inst._order_version   = 0
+        inst._state_epoch     = secrets.token_hex(4)
+        inst._state_version   = 0
+
+        inst._characters.observe(inst._characters_changed)
+        inst._groups.observe(inst._groups_changed)
+        inst._custom_monsters.observe(inst._custom_monsters_changed)
+        return inst
+
+    @classmethod
+    def from_mapping(
+            cls,
+            mapping: SessionMapping,
+            client_broker: SocketBroker,
+            event_broker: EventBroker) -> typing.Self:
+        """
+        Rebuild a session from the output of
+        `into_mapping`. Live connections are not
+        part of the mapping; the session is
+        attached to the given brokers instead.
+        """
+
+        version = mapping.get("v")
+        if version != SESSION_SCHEMA_VERSION:
+            raise ValueError(f"unsupported session schema version: {version!r}")
+
+        current = mapping["current"]
+        inst = cls.new_instance(
+            mapping["name"],
+            client_broker,
+            event_broker,
+            mapping["description"],
+            current_character=request_uuid(current) if current else None,
+            session_uuid=request_uuid(mapping["uuid"]))
+
+        for data in mapping["characters"]:
+            character = CharacterV2.model_validate(data)
+            inst._characters._resource_put(character.creature_uuid, character) #type: ignore
+        for data in mapping["groups"]:
+            group = SessionGroup.from_mapping(data)
+            inst._groups._resource_put(group.group_uuid, group) #type: ignore
+
+        monsters = mapping["monsters"]
+        for data in monsters["items"]:
+            monster = CustomMonster.new_instance(data)
+            inst._custom_monsters._resource_put(data["index"], monster) #type: ignore
+        inst._custom_monsters._next_index = monsters["next"] #type: ignore
         return inst
 
     @property
@@ -378,7 +539,7 @@ class CombatSession[C: SessionSocket](Session[C]):
         return self._custom_monsters
 
     @property
-    def events(self) -> Broker[UUID, Event]:
+    def events(self) -> EventBroker:
         return self._events
 
     @property
@@ -397,6 +558,33 @@ class CombatSession[C: SessionSocket](Session[C]):
     @property
     def session_current_character(self) -> UUID | None:
         return self._session_current_character
+
+    @property
+    def session_lock(self) -> asyncio.Lock:
+        """
+        Held while a sequence of changes must apply
+        without other sequences interleaving.
+        """
+
+        return self._lock
+
+    @property
+    def state_etag(self) -> str:
+        """
+        Entity tag of the current state of this
+        session. Unique to this instance, so it
+        changes if the session is rebuilt.
+        """
+
+        return f'W/"{self._state_epoch}.{self._state_version}"'
+
+    @property
+    def state_version(self) -> int:
+        """
+        Number of mutations made to this session.
+        """
+
+        return self._state_version
     
     @property
     def status(self) -> ServiceStatus:
@@ -457,36 +645,393 @@ class CombatSession[C: SessionSocket](Session[C]):
 
         return client_uuid
 
-    async def owned_events(self):
-        statement: FilterStatement = _filter_statement_event(self) #type: ignore
-        return (await self.events.locate(statement=statement))
+    def _changed(self) -> bool:
+        """
+        Record a mutation of this session. Returns
+        whether there are listeners to notify.
+        """
+
+        self._state_version += 1
+        return bool(self._listeners)
+
+    def _characters_changed(self, op: str, key: UUID, character: Creature | None):
+        self._order_pending.add(key)
+        if not self._changed():
+            return
+        if op == "put":
+            self._notify("character_put", character=_creature_dump(character))
+        else:
+            self._notify("character_pop", uuid=str(key))
+
+    def _current_resolve(self) -> UUID | None:
+        """
+        The character whose turn it is. Falls back
+        to the top of the initiative order if none
+        is set, or it has since been removed. The
+        fallback is not stored, so reading does not
+        change the session.
+        """
+
+        current = self._session_current_character
+        if current is None or self._characters.next_of(current) is None:
+            return self._characters.top()
+        return current
+
+    def _custom_monsters_changed(self, op: str, key: str, monster: CustomMonster | None):
+        if not self._changed():
+            return
+        if op == "put":
+            self._notify("monster_put", monster=monster.monster) #type: ignore
+        else:
+            self._notify("monster_pop", index=key)
+
+    def _group_characters_changed(
+            self,
+            group_uuid: UUID,
+            op: str,
+            key: UUID,
+            character: Creature | None):
+
+        if not self._changed():
+            return
+        if op == "put":
+            self._notify(
+                "group_character_put",
+                group=str(group_uuid),
+                character=_creature_dump(character))
+        else:
+            self._notify("group_character_pop", group=str(group_uuid), uuid=str(key))
+
+    def _groups_changed(self, op: str, key: UUID, group: SessionGroup | None):
+        if op == "put" and not group.characters.resource_listeners: #type: ignore
+            group.characters.observe( #type: ignore
+                functools.partial(self._group_characters_changed, key))
+
+        if not self._changed():
+            return
+        if op == "put":
+            self._notify("group_put", group=group.into_mapping()) #type: ignore
+        else:
+            self._notify("group_pop", uuid=str(key))
+
+    def _notify(self, op: str, **data):
+        for listener in self._listeners:
+            listener(self, op, data)
+
+    def advance_turn(self, step: int = 1) -> UUID | None:
+        """
+        Pass the turn `step` places along the
+        initiative order. Negative steps pass it
+        back. Returns the new current character.
+        """
+
+        current = self._current_resolve()
+        if current is None:
+            return None
+
+        move = self._characters.next_of if step > 0 else self._characters.previous_of
+        for _ in range(abs(step)):
+            current = move(current)
+        self.set_current_character(current)
+        return current
+
+    def apply(self, op: str, data: dict[str, typing.Any]):
+        """
+        Apply a mutation, as given to session
+        listeners, to this session. Used to replay
+        recorded mutations.
+        """
+
+        characters: MemoryBroker[UUID, Creature] = self._characters #type: ignore
+        groups:     MemoryBroker[UUID, SessionGroup] = self._groups #type: ignore
+        monsters:   CustomMonsterMemoryBroker = self._custom_monsters #type: ignore
+
+        match op:
+            case "character_put":
+                character = CharacterV2.model_validate(data["character"])
+                characters._resource_put(character.creature_uuid, character)
+            case "character_pop":
+                characters._resource_pop(request_uuid(data["uuid"]))
+            case "current_set":
+                current = data["uuid"]
+                self.set_current_character(request_uuid(current) if current else None)
+            case "group_put":
+                group = SessionGroup.from_mapping(data["group"])
+                groups._resource_put(group.group_uuid, group)
+            case "group_pop":
+                groups._resource_pop(request_uuid(data["uuid"]))
+            case "group_character_put" | "group_character_pop":
+                group = groups.resource_map.get(request_uuid(data["group"]))
+                if not group:
+                    return
+                group_characters: MemoryBroker = group.characters #type: ignore
+                if op == "group_character_pop":
+                    group_characters._resource_pop(request_uuid(data["uuid"]))
+                    return
+                character = CharacterV2.model_validate(data["character"])
+                group_characters._resource_put(character.creature_uuid, character)
+            case "monster_put":
+                monster = data["monster"]
+                monsters._resource_put(monster["index"], CustomMonster.new_instance(monster))
+                index = monster["index"].removeprefix("custom")
+                if index.isdigit():
+                    monsters._next_index = max(monsters._next_index, int(index) + 1)
+            case "monster_pop":
+                monsters._resource_pop(data["index"])
+            case _:
+                raise ValueError(f"unknown session mutation: {op!r}")
+
+    async def delete(self):
+        # Clients are leaving, so there is no one
+        # left to send a scheduled update to.
+        if self._order_flush is not None:
+            self._order_flush.cancel()
+            self._order_flush = None
+        self._order_actions.clear()
+
+        await super().delete()
+
+        # Events are only meaningful to the session
+        # they belong to. Drop them with it.
+        await self.events.delete_session(self.session_uuid)
+
+    async def owned_events(self, limit: int | None = None):
+        """
+        Events belonging to this session, oldest
+        first. If `limit` is given, only the newest
+        `limit` events are returned.
+        """
+
+        return (await self.events.locate_session(self.session_uuid, limit))
     
+    def into_mapping(self) -> SessionMapping:
+        """
+        Transform this session into a JSON
+        serializable mapping. Live connections and
+        events are left out.
+        """
+
+        current = self.session_current_character
+        return {
+            "v": SESSION_SCHEMA_VERSION,
+            "uuid": str(self.session_uuid),
+            "name": self._session_name,
+            "description": self._session_description,
+            "current": str(current) if current else None,
+            "characters": [_creature_dump(c) for c in self._characters], #type: ignore
+            "groups": [g.into_mapping() for g in self._groups], #type: ignore
+            "monsters": {
+                "next": self._custom_monsters._next_index, #type: ignore
+                "items": [m.monster for m in self._custom_monsters] #type: ignore
+            }
+        }
+
+    def observe(self, listener: SessionListener):
+        """
+        Register a callback notified of each
+        mutation to this session.
+        """
+
+        self._listeners.append(listener)
+
+    async def _order_update_flush(self):
+        await asyncio.sleep(self.order_update_window)
+        await self.flush_order_update()
+
+    def schedule_order_update(self, action: Action | None = None):
+        """
+        Send clients the changes made to the
+        initiative order after
+        `order_update_window` seconds. Updates
+        scheduled in the meantime are merged into
+        the same send.
+        """
+
+        action = action or all_send_event_action
+        if action not in self._order_actions:
+            self._order_actions.append(action)
+        if self._order_flush is None:
+            self._order_flush = asyncio.create_task(self._order_update_flush())
+
+    async def flush_order_update(
+            self,
+            *,
+            single: bool = False) -> typing.Sequence[ActionResult]:
+        """
+        Send any scheduled order update right away.
+        With `single`, it is sent as one broadcast
+        to every client, rather than once for each
+        audience it was scheduled for.
+        """
+
+        flush, self._order_flush = self._order_flush, None
+        if flush is not None and flush is not asyncio.current_task():
+            flush.cancel()
+
+        actions, self._order_actions = self._order_actions, []
+        if not actions:
+            return ()
+
+        # Every client is sent the update at most
+        # once, even if a narrower audience was
+        # also scheduled.
+        if all_send_event_action in actions or (single and len(actions) > 1):
+            actions = [all_send_event_action]
+
+        event   = ReceiveOrderUpdate(self.take_order_update())
+        results = []
+        for action in actions:
+            results.extend(await self.broadcast_action(action, event=event))
+        return results
+
     def set_current_character(self, new_current_character: UUID | None):
         self._session_current_character = new_current_character
 
+        if not self._changed():
+            return
+        current = new_current_character
+        self._notify("current_set", uuid=str(current) if current else None)
+
+    def take_order_update(self) -> OrderUpdate:
+        """
+        Collect the changes made to the initiative
+        order since the last update was taken.
+        Only characters which changed are included.
+        """
+
+        current = self._current_resolve()
+        update  = OrderUpdate(
+            version=self._state_version,
+            base_version=self._order_version,
+            current=str(current) if current else None)
+
+        characters = self._characters.resource_map
+        for key in self._order_pending:
+            character = characters.get(key)
+            if character is None:
+                if key in self._order_known:
+                    update.removed.append(str(key))
+                    self._order_known.discard(key)
+            elif key in self._order_known:
+                update.changed.append(character.model_dump(mode="json")) #type: ignore
+            else:
+                update.added.append(character.model_dump(mode="json")) #type: ignore
+                self._order_known.add(key)
+
+        self._order_pending.clear()
+        self._order_version = update.version
+        return update
+
+    def turn_order(self) -> list[Creature]:
+        """
+        Characters in initiative order, starting
+        from the character whose turn it is.
+        """
+
+        return self._characters.ordered(self._current_resolve())
+
+
+def _creature_dump(creature: Creature) -> dict[str, typing.Any]:
+    return creature.model_dump(mode="json", exclude_defaults=True) #type: ignore
+
+
+def dumps_session(session: CombatSession) -> str:
+    """
+    Encode a session as compact `JSON`.
+    """
+
+    return json.dumps(session.into_mapping(), separators=(",", ":"))
+
+
+def loads_session(
+        data: str | bytes,
+        client_broker: SocketBroker,
+        event_broker: EventBroker,
+        cls: type[CombatSession] = CombatSession) -> CombatSession:
+    """
+    Decode a session encoded by `dumps_session`.
+    """
+
+    return cls.from_mapping(json.loads(data), client_broker, event_broker)
+
 
 class SessionMemoryBroker(MemoryBroker[UUID, Session]):
     """
     Implementation of `MemoryBroker` for storing
     and maintaining `Session` objects.
+
+    If given a `journal`, every session mutation
+    is journaled and sessions are restored from it
+    when the broker starts up.
     """
 
+    session_clients: SocketBroker | None
+    session_events:  EventBroker | None
+    session_journal: "SessionJournal | None"
+
+    def __init__(
+            self,
+            cls: type[Session],
+            max_size: int | None = None,
+            *,
+            client_broker: SocketBroker | None = None,
+            event_broker: EventBroker | None = None,
+            journal: "SessionJournal | None" = None,
+            **kwds):
+
+        super().__init__(cls, max_size, **kwds)
+        self.session_clients = client_broker
+        self.session_events  = event_broker
+        self.session_journal = journal
+
+    def _resource_pop(self, key: UUID):
+        session = super()._resource_pop(key)
+        if session is not None and self.session_journal:
+            self.session_journal.detach(session) #type: ignore
+        return session
+
+    def _resource_put(self, key: UUID, resource: Session):
+        super()._resource_put(key, resource)
+        if self.session_journal:
+            self.session_journal.attach(resource) #type: ignore
+
+    async def shutdown(self):
+        await super().shutdown()
+        if self.session_journal:
+            await self.session_journal.close()
+
+    async def startup(self):
+        await super().startup()
+        if not self.session_journal:
+            return
+
+        restored = self.session_journal.restore(
+            self.session_clients, #type: ignore
+            self.session_events, #type: ignore
+            self.resource_cls) #type: ignore
+        for session in restored:
+            super()._resource_put(session.session_uuid, session)
+            self.session_journal.attach(session, record=False)
+        self.session_journal.open()
+
     @typing.override
     async def create(
             self,
             name: str,
             client_broker: SocketBroker,
             event_broker: EventBroker,
-            description: str | None = None):
+            description: str | None = None,
+            session_uuid: UUID | None = None):
 
         session = self.resource_cls.new_instance(
             name,
             client_broker,
             event_broker,
-            description)
+            description,
+            session_uuid=session_uuid)
         
         session_uuid = session.session_uuid
-        self.resource_map[session_uuid] = session
+        self._resource_put(session_uuid, session)
         return (session_uuid, session)
 
 
@@ -497,35 +1042,62 @@ class SessionRedisBroker(RedisBroker[UUID, Session]):
     semi-persistent state.
     """
 
+    session_clients: SocketBroker | None
+    session_events:  EventBroker | None
+
+    def __init__(
+            self,
+            cls: type[CombatSession],
+            url: str,
+            *,
+            client_broker: SocketBroker | None = None,
+            event_broker: EventBroker | None = None,
+            **kwds):
+        """
+        Initialize a `SessionRedisBroker`. Sessions
+        loaded from the server are attached to the
+        given client and event brokers.
+        """
+
+        super().__init__(cls, url, **kwds) #type: ignore
+        self.session_clients = client_broker
+        self.session_events  = event_broker
+
     @typing.override
     async def create(
             self,
             name: str,
             client_broker: SocketBroker,
             event_broker: EventBroker,
-            description: str | None = None):
+            description: str | None = None,
+            session_uuid: UUID | None = None):
 
         session = self.resource_cls.new_instance(
             name, 
             client_broker,
             event_broker,
-            description)
+            description,
+            session_uuid=session_uuid)
         
-        session_uuid = session.session_uuid
+        self.session_clients = self.session_clients or client_broker
+        self.session_events  = self.session_events or event_broker
 
-        rkey = f"{self.resource_cls.__name__}:{session_uuid!s}"
-        # TODO: into_mapping is not defined, nor 
-        # implemented.
-        rdat = json.dumps(session.into_mapping(session))
-        self.redis_client.set(rkey, rdat)
+        session_uuid = session.session_uuid
+        await self.modify(session_uuid, session)
         return (session_uuid, session)
 
-    async def modify(self, key: UUID, resource: Session):
-        rkey = f"{self.resource_cls.__name__}:{resource.session_uuid!s}"
-        # TODO: into_mapping is not defined, nor 
-        # implemented.
-        rdat = json.dumps(resource.into_mapping(resource))
-        self.redis_client.set(rkey, rdat)
+    def _resource_dumps(self, resource: Session) -> str:
+        return dumps_session(resource) #type: ignore
+
+    def _resource_loads(self, data: str) -> Session:
+        return loads_session(
+            data,
+            self.session_clients, #type: ignore
+            self.session_events, #type: ignore
+            self.resource_cls) #type: ignore
+
+    def _resource_key(self, rkey: str) -> UUID:
+        return request_uuid(super()._resource_key(rkey))
 
 
 class SessionShelver(ShelfBroker[Session]):
@@ -541,25 +1113,58 @@ class SessionShelver(ShelfBroker[Session]):
     development.
     """
 
+    session_clients: SocketBroker | None
+    session_events:  EventBroker | None
+
+    def __init__(
+            self,
+            shelf_name: str,
+            cls: type[CombatSession],
+            *,
+            client_broker: SocketBroker | None = None,
+            event_broker: EventBroker | None = None):
+        """
+        Initialize a `SessionShelver`. Sessions
+        loaded from the shelf are attached to the
+        given client and event brokers.
+        """
+
+        super().__init__(shelf_name, cls) #type: ignore
+        self.session_clients = client_broker
+        self.session_events  = event_broker
+
     @typing.override
     async def create(
             self,
             name: str,
             client_broker: SocketBroker,
             event_broker: EventBroker,
-            description: str | None = None):
+            description: str | None = None,
+            session_uuid: UUID | None = None):
 
         session = self.resource_cls.new_instance(
             name,
             client_broker, 
             event_broker,
-            description)
-        
+            description,
+            session_uuid=session_uuid)
+
+        self.session_clients = self.session_clients or client_broker
+        self.session_events  = self.session_events or event_broker
+
         session_uuid = str(session.session_uuid)
-        with self as opened:
-            opened.shelf[session_uuid] = session
+        await self.modify(session_uuid, session)
         return (session_uuid, session)
 
-    async def modify(self, key: str, resource: Session):
-        with self as opened:
-            opened.shelf[key] = resource
+    def _resource_dumps(self, resource: Session) -> str:
+        # Sessions hold live connections which
+        # cannot be pickled; store the compact
+        # encoding instead.
+        return dumps_session(resource) #type: ignore
+
+    def _resource_loads(self, data: str) -> Session:
+        return loads_session(
+            data,
+            self.session_clients, #type: ignore
+            self.session_events, #type: ignore
+            self.resource_cls) #type: ignore
@@ -3,7 +3,7 @@ import abc, typing
 from fastapi import WebSocket
 
 from scryer.creatures import HitPoints, Role
-from scryer.services.brokers import Broker, MemoryBroker
+from scryer.services.brokers import Broker, Located, MemoryBroker
 from scryer.services.service import ServiceStatus
 from scryer.util import UUID, request_uuid
 
@@ -39,14 +39,73 @@ class SocketBroker(Broker[UUID, SessionSocket]):
         the connection based on our needs.
         """
 
+    async def locate_session(
+            self,
+            session_uuid: UUID) -> Located[UUID, SessionSocket]:
+        """
+        Find all connections attached to the
+        given session.
+        """
+
+        return await self.locate(statement={
+            "logic": "and",
+            "filters": [
+                {
+                    "field": "cookies.session_uuid",
+                    "operator": "eq",
+                    "value": session_uuid
+                }
+            ]
+        })
+
 
 class SocketMemoryBroker(SocketBroker, MemoryBroker[UUID, SessionSocket]):
     """
     Implementation of a memory broker which
     manages socket connections between server and
     client.
+
+    Connections are partitioned by the session
+    they are attached to, so session wide lookups
+    only touch that session's sockets.
     """
-    
+
+    socket_partitions: dict[UUID, dict[UUID, SessionSocket]]
+    socket_sessions:   dict[UUID, UUID]
+
+    def __init__(self, cls: type[SessionSocket], *args, **kwds):
+        super().__init__(cls, *args, **kwds)
+        self.socket_partitions = dict()
+        self.socket_sessions   = dict()
+
+    def _partition_discard(self, client_uuid: UUID):
+        session_uuid = self.socket_sessions.pop(client_uuid, None)
+        if session_uuid is None:
+            return
+
+        partition = self.socket_partitions[session_uuid]
+        partition.pop(client_uuid, None)
+        if not partition:
+            del self.socket_partitions[session_uuid]
+
+    def _resource_pop(self, key: UUID):
+        self._partition_discard(key)
+        return super()._resource_pop(key)
+
+    def _resource_put(self, key: UUID, resource: SessionSocket):
+        super()._resource_put(key, resource)
+        self._partition_discard(key)
+
+        session_uuid = resource.cookies.get("session_uuid")
+        if session_uuid is None:
+            return
+        self.socket_sessions[key] = session_uuid
+        self.socket_partitions.setdefault(session_uuid, dict())[key] = resource
+
+    async def locate_session(self, session_uuid: UUID):
+        partition = self.socket_partitions.get(session_uuid, {})
+        return tuple(partition.items())
+
     async def create(self, sock: SessionSocket):
         client_uuid = sock.cookies["client_uuid"]
 
@@ -55,6 +114,6 @@ class SocketMemoryBroker(SocketBroker, MemoryBroker[UUID, SessionSocket]):
             await sock.close()
             return (client_uuid, sock)
 
-        self.resource_map[client_uuid] = sock
+        self._resource_put(client_uuid, sock)
 
         return (client_uuid, sock)
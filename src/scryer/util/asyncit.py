@@ -13,4 +13,7 @@ class _aiter[T]:
         return self
 
     async def __anext__(self) -> T:
-        return next(self.obj_iter)
+        try:
+            return next(self.obj_iter)
+        except StopIteration:
+            raise StopAsyncIteration from None
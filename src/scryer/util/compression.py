@@ -0,0 +1,228 @@
+"""
+Compression of HTTP responses. Brotli is used
+when it is installed and the client accepts it,
+otherwise gzip.
+"""
+
+import collections, typing, zlib
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    # Optional. Clients fall back to gzip without
+    # it.
+    import brotli #type: ignore
+    BROTLI_IMPLEMENTED = True
+except ImportError:
+    BROTLI_IMPLEMENTED = False
+
+__all__ = (
+    "CompressionMiddleware",
+    "PayloadCache",
+    "compress",
+    "negotiate_encoding"
+)
+
+
+class Compressor(typing.Protocol):
+    def compress(self, data: bytes) -> bytes: ...
+    def flush(self) -> bytes: ...
+    def finish(self) -> bytes: ...
+
+
+class _BrotliCompressor:
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class _GzipCompressor:
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+def compressor(encoding: str, level: int | None = None) -> Compressor:
+    """A streaming compressor for an encoding."""
+
+    if encoding == "br":
+        return _BrotliCompressor(5 if level is None else level)
+    return _GzipCompressor(6 if level is None else level)
+
+
+def compress(data: bytes, encoding: str, level: int | None = None) -> bytes:
+    """Compress a whole payload."""
+
+    comp = compressor(encoding, level)
+    return comp.compress(data) + comp.finish()
+
+
+def negotiate_encoding(accept_encoding: str) -> str | None:
+    """
+    The encoding to compress a response with,
+    given the client's `Accept-Encoding`. `None` if
+    the client accepts neither.
+    """
+
+    accepted = set()
+    for part in accept_encoding.lower().split(","):
+        coding, _, params = part.strip().partition(";")
+        if params.replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        accepted.add(coding.strip())
+
+    if BROTLI_IMPLEMENTED and "br" in accepted:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return None
+
+
+class PayloadCache:
+    """
+    Compressed payloads keyed by what they
+    represent, so each is only compressed once.
+    The least recently used are dropped past
+    `max_entries`.
+    """
+
+    cache_entries:     collections.OrderedDict[typing.Hashable, typing.Any]
+    cache_max_entries: int
+
+    def __init__(self, max_entries: int = 256):
+        self.cache_entries     = collections.OrderedDict()
+        self.cache_max_entries = max_entries
+
+    def get(self, key: typing.Hashable) -> typing.Any | None:
+        found = self.cache_entries.get(key)
+        if found is not None:
+            self.cache_entries.move_to_end(key)
+        return found
+
+    def put(self, key: typing.Hashable, value: typing.Any):
+        self.cache_entries[key] = value
+        self.cache_entries.move_to_end(key)
+        while len(self.cache_entries) > self.cache_max_entries:
+            self.cache_entries.popitem(last=False)
+
+
+class CompressionMiddleware:
+    """
+    Compresses responses of at least
+    `minimum_size` bytes. Streamed responses are
+    held back until that much has been produced,
+    then compressed as they are sent. Responses which
+    already have a `Content-Encoding`, such as
+    payloads compressed ahead of time, are passed
+    through untouched.
+    """
+
+    app:          ASGIApp
+    level:        int | None
+    minimum_size: int
+
+    def __init__(self, app: ASGIApp, *, minimum_size: int = 1024, level: int | None = None):
+        self.app          = app
+        self.level        = level
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(send, encoding, self.level, self.minimum_size)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    compressor:   Compressor | None
+    encoding:     str
+    level:        int | None
+    minimum_size: int
+    passthrough:  bool
+    pending:      bytes
+    start:        Message | None
+
+    _send: Send
+
+    def __init__(self, send: Send, encoding: str, level: int | None, minimum_size: int):
+        self.compressor   = None
+        self.encoding     = encoding
+        self.level        = level
+        self.minimum_size = minimum_size
+        self.passthrough  = False
+        self.pending      = b""
+        self.start        = None
+
+        self._send = send
+
+    async def send(self, message: Message):
+        mtype = message["type"]
+        if self.passthrough or mtype not in ("http.response.start", "http.response.body"):
+            await self._send(message)
+            return
+
+        if mtype == "http.response.start":
+            self.start = message
+            self.passthrough = "content-encoding" in Headers(raw=message["headers"])
+            if self.passthrough:
+                await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more = message.get("more_body", False)
+        if self.compressor is None:
+            # Not worth compressing until the body is
+            # known to reach the minimum size.
+            body, self.pending = self.pending + body, b""
+            if more and len(body) < self.minimum_size:
+                self.pending = body
+                return
+            if not more and len(body) < self.minimum_size:
+                self.passthrough = True
+                await self._send(self.start) #type: ignore
+                await self._send({"type": mtype, "body": body})
+                return
+
+            self.compressor = compressor(self.encoding, self.level)
+            headers = MutableHeaders(raw=self.start["headers"]) #type: ignore
+            headers["Content-Encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+            if more:
+                del headers["Content-Length"]
+            else:
+                body = compress(body, self.encoding, self.level)
+                headers["Content-Length"] = str(len(body))
+                await self._send(self.start) #type: ignore
+                await self._send({"type": mtype, "body": body})
+                return
+            await self._send(self.start) #type: ignore
+
+        # Flush every chunk so streamed items reach
+        # the client as they are produced.
+        data = self.compressor.compress(body)
+        data += self.compressor.flush() if more else self.compressor.finish()
+        await self._send({"type": mtype, "body": data, "more_body": more})
@@ -1,22 +1,32 @@
-import enum, typing
+import enum, functools, typing
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, PrivateAttr
 from scryer.creatures.attrs import Role
 
 from scryer.util import UUID
+from scryer.util.wire import WireData, WireFormat, wire_encoder
 
 __all__ = (
     "Event",
     "ClientUUID",
+    "HeartbeatPing",
     "Message",
     "JoinSession",
+    "OrderUpdate",
+    "Ping",
     "ReceiveClientUUID",
     "ReceiveOrderUpdate",
     "ReceiveRoll",
     "ReceiveMessage",
     "RequestRoll",
+    "RpcCall",
+    "RpcResponse",
+    "RpcResult",
     "SessionJoinBody",
-    "dump_event"
+    "SessionOffer",
+    "dump_event",
+    "encode_event",
+    "event_encoder"
 )
 
 type PartialEvent[B, **P] = typing.Callable[typing.Concatenate[B, P], Event]
@@ -41,6 +51,11 @@ class SessionJoinBody(typing.TypedDict):
     role: Role
     name: str
     client_uuid: str
+    wire_formats: typing.NotRequired[list[str]]
+    """
+    Wire formats the client accepts, most
+    preferred first.
+    """
 
 
 class EventType(enum.StrEnum):
@@ -58,6 +73,12 @@ class EventType(enum.StrEnum):
     JOIN_SESSION          = enum.auto()
     END_SESSION           = enum.auto()
 
+    PING                  = enum.auto()
+    PONG                  = enum.auto()
+
+    RPC_REQUEST           = enum.auto()
+    RPC_RESPONSE          = enum.auto()
+
 
 
 class Event(BaseEvent):
@@ -69,6 +90,10 @@ class Event(BaseEvent):
     event_body:   EventBody | None = None
     event_type:   EventType | None = None
 
+    # Only events sent in formats other than JSON
+    # need one.
+    _encodings: dict[WireFormat, tuple[str | bytes, int]] | None = PrivateAttr(default=None)
+
     @property
     def send_to(self) -> typing.Sequence[UUID]:
         """
@@ -78,9 +103,36 @@ class Event(BaseEvent):
         clients = getattr(self.event_body, "client_uuids", None)
         return clients or ()
 
+    @functools.cached_property
+    def encoded(self) -> tuple[str, int]:
+        """
+        This event encoded as `JSON` text, and the
+        size of that text in bytes. Encoded once
+        no matter how many clients it is sent to.
+        """
+
+        return encode_event(self)
+
+    def encoded_as(self, fmt: WireFormat) -> tuple[str | bytes, int]:
+        """
+        This event encoded in a wire format, and
+        the size of that encoding in bytes. Each
+        format is encoded at most once.
+        """
+
+        if fmt is WireFormat.JSON:
+            return self.encoded
+        if self._encodings is None:
+            self._encodings = dict()
+        if fmt not in self._encodings:
+            data = event_encoder(self.event_type, fmt)(self)
+            self._encodings[fmt] = (data, len(data))
+        return self._encodings[fmt]
+
 
 class ClientUUID(EventBody):
     client_uuid: str
+    wire_format: WireFormat = WireFormat.JSON
 
 
 class RequestPlayerInput(EventBody):
@@ -100,6 +152,66 @@ class NewCurrentOrder(EventBody):
     creature_uuid: str | None
 
 
+class OrderUpdate(EventBody):
+    """
+    Changes made to the initiative order of a
+    session, between `base_version` and `version`.
+    Clients which did not last see `base_version`
+    must fetch the full order instead.
+    """
+
+    version:      int
+    base_version: int | None = None
+    added:        list[dict[str, typing.Any]] = []
+    changed:      list[dict[str, typing.Any]] = []
+    removed:      list[str] = []
+    current:      str | None = None
+
+
+class HeartbeatPing(EventBody):
+    """
+    Sent to clients periodically. Clients answer
+    with a `pong` event carrying the same body.
+    """
+
+    nonce: int
+
+
+class RpcCall(EventBody):
+    """
+    A client calling a method over its session
+    connection. The response carries the same
+    `request_id`.
+    """
+
+    request_id: str | int | None = None
+    method:     str
+    params:     dict[str, typing.Any] = {}
+
+
+class RpcResult(EventBody):
+    """
+    The outcome of an `RpcCall`. Either `result` or
+    `error` is set, depending on `ok`. Errors have
+    the `status` and `detail` an HTTP request for
+    the same would have failed with.
+    """
+
+    request_id: str | int | None
+    ok:         bool
+    result:     typing.Any = None
+    error:      dict[str, typing.Any] | None = None
+
+
+class SessionOffer(EventBody):
+    """
+    Sent to a client when it connects. Lists the
+    wire formats it may ask for when joining.
+    """
+
+    wire_formats: list[WireFormat]
+
+
 class PlayerInput(EventBody):
     """
     This is the request and response class for
@@ -123,17 +235,20 @@ class PlayerMessage(EventBody):
     client_uuids: list[UUID]
 
 
-def dump_event(event: Event) -> dict[str, object]:
+def dump_event(
+        event: Event,
+        *,
+        mode: typing.Literal["json", "python"] = "python") -> dict[str, object]:
     """
     Transform an event into a dictionary
     representation of itself.
     """
 
-    dump = event.model_dump()
+    dump = event.model_dump(mode=mode)
     if "event_body" in dump and not dump["event_body"]:
         # Event body was empty. Most likely due to
         # an issue with model inheritence.
-        event_body = event.event_body.model_dump() #type: ignore
+        event_body = event.event_body.model_dump(mode=mode) #type: ignore
         if isinstance(event_body, dict) and "client_uuids" in event_body:
             event_body["client_uuids"] = [
                 str(u) for u in event_body["client_uuids"]
@@ -142,6 +257,36 @@ def dump_event(event: Event) -> dict[str, object]:
     return dump
 
 
+def encode_event(event: Event) -> tuple[str, int]:
+    """
+    Encode an event as compact `JSON` text.
+    Returns the text and its size in bytes.
+    """
+
+    text: str = event_encoder(event.event_type, WireFormat.JSON)(event) #type: ignore
+    return text, len(text.encode())
+
+
+@functools.cache
+def event_encoder(
+        etype: EventType | None,
+        fmt: WireFormat) -> typing.Callable[[Event], WireData]:
+    """
+    Encoder of events of a type in a wire format.
+    Built once for each pair, rather than for
+    each event sent.
+    """
+
+    encode = wire_encoder(fmt)
+    # `JSON` encodes values it does not know as
+    # strings itself.
+    mode: typing.Literal["json", "python"] = "python" if fmt is WireFormat.JSON else "json"
+
+    def encoder(event: Event) -> WireData:
+        return encode(dump_event(event, mode=mode))
+    return encoder
+
+
 def NewEvent(
         etype: EventType,
         ebody: EventBody,
@@ -179,3 +324,9 @@ def RequestRoll(body: EventBody, **kwds):
 
 def EndSession(body: EventBody, **kwds):
     return NewEvent(EventType.END_SESSION, body, **kwds)
+
+def Ping(body: EventBody, **kwds):
+    return NewEvent(EventType.PING, body, **kwds)
+
+def RpcResponse(body: EventBody, **kwds):
+    return NewEvent(EventType.RPC_RESPONSE, body, **kwds)
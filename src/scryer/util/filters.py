@@ -1,7 +1,16 @@
-import enum, typing
+import enum, functools, typing
 
 type BinaryOperation[A, B, R] = typing.Callable[[A, B], R]
 type FilterValidator          = typing.Callable[[typing.Any], bool]
+type FieldAccessor            = typing.Callable[[typing.Any], typing.Any]
+type CanonicalRule            = tuple[tuple[str, ...], LogicalOp, type, typing.Any]
+type CanonicalStatement       = tuple[LogicalOp, tuple[CanonicalRule, ...]]
+
+NOT_FOUND = object()
+"""
+Sentinel returned when a field path cannot be
+resolved against an object.
+"""
 
 
 class LogicalOp(enum.StrEnum):
@@ -58,38 +67,158 @@ class FilterStatement(typing.TypedDict):
     logic:   str | LogicalOp
 
 
+def resolve_field(obj: object, field: str | typing.Sequence[str]) -> typing.Any:
+    """
+    Resolve a dotted field path against an
+    object. Nested parts may be either attributes
+    or mapping keys. Returns `NOT_FOUND` if any
+    nested part cannot be resolved.
+    """
+
+    field_parts = field.split(".") if isinstance(field, str) else field
+    obj_value   = getattr(obj, field_parts[0])
+    for part in field_parts[1:]:
+
+        if isinstance(obj_value, dict):
+            obj_value = obj_value.get(part, NOT_FOUND)
+        else:
+            obj_value = getattr(obj_value, part, NOT_FOUND)
+
+        if obj_value is NOT_FOUND:
+            return NOT_FOUND
+
+    return obj_value
+
+
+def canonical_statement(statement: FilterStatement) -> CanonicalStatement:
+    """
+    Normalize a filter statement into a hashable
+    form. Identical statements produce equal
+    canonical forms regardless of whether their
+    operators were given as strings or
+    `LogicalOp` members.
+    """
+
+    logic = LogicalOp.from_other(statement["logic"])
+    rules = tuple(
+        (
+            tuple(f["field"].split(".")),
+            LogicalOp.from_other(f["operator"]),
+            # The value type is kept so values
+            # that compare equal, but are not the
+            # same (e.g. `1` and `True`), do not
+            # share a compiled predicate.
+            type(f["value"]),
+            f["value"]
+        )
+        for f in statement["filters"]
+    )
+    return (logic, rules)
+
+
+def compile_statement(statement: FilterStatement) -> FilterValidator:
+    """
+    Compile a filter statement into a predicate.
+    Compiled predicates are memoized by the
+    canonical form of the statement; statements
+    with unhashable values are compiled each
+    time.
+    """
+
+    canonical = canonical_statement(statement)
+    try:
+        return _compile_cached(canonical)
+    except TypeError:
+        return _compile_canonical(canonical)
+
+
 def compose_validator(statement: FilterStatement) -> FilterValidator:
     """
     Creates a validator from a filter statemnt.
     """
 
-    logic   = LogicalOp.from_other(statement["logic"])
-    filters = statement["filters"]
+    return compile_statement(statement)
 
-    if not filters:
-        return (lambda _: True)
 
-    def validator(obj: object) -> bool:
-        res = True
+def _compile_accessor(field_parts: tuple[str, ...]) -> FieldAccessor:
+    """
+    Resolve a field path once into a callable
+    that fetches the value from an object.
+    """
+
+    head, rest = field_parts[0], field_parts[1:]
+    if not rest:
+        return lambda obj: getattr(obj, head)
+
+    def accessor(obj: object) -> typing.Any:
+        obj_value = getattr(obj, head)
+        for part in rest:
 
-        for f in filters:
-            op = LogicalOp.from_other(f["operator"])
+            if isinstance(obj_value, dict):
+                obj_value = obj_value.get(part, NOT_FOUND)
+            else:
+                obj_value = getattr(obj_value, part, NOT_FOUND)
 
-            field_parts = f["field"].split(".")
-            obj_value   = getattr(obj, field_parts[0])
-            for part in field_parts[1:]:
+            if obj_value is NOT_FOUND:
+                return NOT_FOUND
 
-                if isinstance(obj_value, dict):
-                    obj_value = obj_value.get(part, "NOT_FOUND")
-                else:
-                    obj_value = getattr(obj_value, part, "NOT_FOUND")
+        return obj_value
 
-                if obj_value == "NOT_FOUND":
+    return accessor
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_cached(canonical: CanonicalStatement) -> FilterValidator:
+    return _compile_canonical(canonical)
+
+
+def _compile_canonical(canonical: CanonicalStatement) -> FilterValidator:
+    logic, rules = canonical
+    if not rules:
+        return (lambda _: True)
+
+    predicates = tuple(_compile_rule(*rule) for rule in rules)
+    if len(predicates) == 1:
+        return predicates[0]
+
+    if logic is LogicalOp.AND:
+        def validator(obj: object) -> bool:
+            for p in predicates:
+                if not p(obj):
                     return False
+            return True
+        return validator
 
-            fil_value = f["value"]
-            res  = logic.do(res, op.do(fil_value, obj_value))
+    if logic is LogicalOp.OR:
+        def validator(obj: object) -> bool:
+            for p in predicates:
+                if p(obj):
+                    return True
+            return False
+        return validator
 
+    def validator(obj: object) -> bool:
+        res = True
+        for p in predicates:
+            res = logic.do(res, p(obj))
         return res
 
     return validator
+
+
+def _compile_rule(
+        field_parts: tuple[str, ...],
+        op: LogicalOp,
+        _: type,
+        fil_value: typing.Any) -> FilterValidator:
+
+    accessor = _compile_accessor(field_parts)
+    do       = op.do
+
+    def predicate(obj: object) -> bool:
+        obj_value = accessor(obj)
+        if obj_value is NOT_FOUND:
+            return False
+        return do(fil_value, obj_value)
+
+    return predicate
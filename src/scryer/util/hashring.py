@@ -0,0 +1,73 @@
+"""
+Consistent hashing of keys onto a changing set of
+nodes.
+"""
+
+import bisect, hashlib, typing
+
+__all__ = ("HashRing", "ring_hash")
+
+
+def ring_hash(value: str) -> int:
+    """Stable 64-bit hash of a string."""
+
+    digest = hashlib.blake2b(value.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+class HashRing[N: str]:
+    """
+    Maps keys onto nodes such that adding or
+    removing a node only moves the keys owned by
+    that node. Each node is placed on the ring
+    `replicas` times to spread keys evenly.
+    """
+
+    ring_nodes:    set[N]
+    ring_points:   list[tuple[int, N]]
+    ring_replicas: int
+
+    def __init__(self, nodes: typing.Iterable[N] = (), *, replicas: int = 160):
+        self.ring_nodes    = set()
+        self.ring_points   = list()
+        self.ring_replicas = replicas
+
+        for node in nodes:
+            self.add(node)
+
+    def __contains__(self, node: object) -> bool:
+        return node in self.ring_nodes
+
+    def __len__(self) -> int:
+        return len(self.ring_nodes)
+
+    def add(self, node: N):
+        """Place a node on the ring."""
+
+        if node in self.ring_nodes:
+            return
+
+        self.ring_nodes.add(node)
+        for replica in range(self.ring_replicas):
+            bisect.insort(self.ring_points, (ring_hash(f"{node}#{replica}"), node))
+
+    def node_for(self, key: str) -> N | None:
+        """
+        The node owning a key. `None` if the ring
+        is empty.
+        """
+
+        if not self.ring_points:
+            return None
+
+        index = bisect.bisect(self.ring_points, (ring_hash(key), ""))
+        return self.ring_points[index % len(self.ring_points)][1]
+
+    def remove(self, node: N):
+        """Take a node off the ring."""
+
+        if node not in self.ring_nodes:
+            return
+
+        self.ring_nodes.discard(node)
+        self.ring_points = [p for p in self.ring_points if p[1] != node]
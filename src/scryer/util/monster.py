@@ -71,7 +71,7 @@ class CustomMonsterMemoryBroker(MemoryBroker[str, CustomMonster]):
         monster = self.resource_cls.new_instance(
             dict)
         
-        self.resource_map[index] = monster
+        self._resource_put(index, monster)
 
         self._next_index += 1
         return (index, dict)
\ No newline at end of file
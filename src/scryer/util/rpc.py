@@ -0,0 +1,88 @@
+"""
+Remote procedure calls made by clients over their
+session connection. Methods are plain coroutine
+functions, usually the same handlers served by
+the REST routes.
+"""
+
+import inspect, typing
+
+from pydantic import TypeAdapter, ValidationError
+
+__all__ = ("RpcError", "RpcMethod")
+
+
+class RpcError(Exception):
+    """
+    A call which could not be made. Mirrors an
+    HTTP error status.
+    """
+
+    status: int
+    detail: typing.Any
+
+    def __init__(self, status: int, detail: typing.Any):
+        super().__init__(status, detail)
+        self.status = status
+        self.detail = detail
+
+
+class RpcMethod[R]:
+    """
+    A coroutine function callable with a mapping
+    of parameters. Each parameter is validated
+    against the type it is annotated with.
+    Parameters named in `bound` are supplied by
+    the server instead of the caller.
+    """
+
+    rpc_call:     typing.Callable[..., typing.Awaitable[R]]
+    rpc_defaults: dict[str, typing.Any]
+    rpc_params:   dict[str, TypeAdapter]
+
+    def __init__(
+            self,
+            call: typing.Callable[..., typing.Awaitable[R]],
+            *,
+            bound: typing.Iterable[str] = ()):
+
+        self.rpc_call     = call
+        self.rpc_defaults = dict()
+        self.rpc_params   = dict()
+
+        bound = set(bound)
+        hints = typing.get_type_hints(call)
+        for name, param in inspect.signature(call).parameters.items():
+            if name in bound:
+                continue
+            self.rpc_params[name] = TypeAdapter(hints.get(name, typing.Any))
+            if param.default is not inspect.Parameter.empty:
+                self.rpc_defaults[name] = param.default
+
+    async def __call__(self, params: typing.Mapping[str, typing.Any], **bound) -> R:
+        """
+        Validate `params`, then call the method with
+        them and the `bound` parameters.
+        """
+
+        unknown = set(params) - set(self.rpc_params)
+        if unknown:
+            raise RpcError(422, f"Unknown parameters: {', '.join(sorted(unknown))}")
+
+        kwds, errors = {}, []
+        for name, adapter in self.rpc_params.items():
+            if name not in params:
+                if name in self.rpc_defaults:
+                    continue
+                errors.append({"loc": [name], "msg": "Field required", "type": "missing"})
+                continue
+            try:
+                kwds[name] = adapter.validate_python(params[name])
+            except ValidationError as e:
+                errors.extend(
+                    {"loc": [name, *map(str, err["loc"])], "msg": err["msg"], "type": err["type"]}
+                    for err in e.errors(include_url=False, include_context=False))
+
+        if errors:
+            raise RpcError(422, errors)
+        return await self.rpc_call(**kwds, **bound)
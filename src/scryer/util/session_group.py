@@ -20,7 +20,8 @@ from scryer.util import UUID, request_uuid
 __all__ = (
     "SessionGroup",
     "sessionGroupApi"
-    "SessionGroupMemoryBroker"
+    "SessionGroupMemoryBroker",
+    "SessionGroupMove"
 )
 
 class SessionGroupApi(BaseModel):
@@ -28,6 +29,17 @@ class SessionGroupApi(BaseModel):
     group_name: str
 
 
+class SessionGroupMove(BaseModel):
+    """
+    Move a character between groups. A group of
+    `None` is the field, i.e. the initiative order.
+    """
+
+    character_uuid: UUID
+    source_group:   UUID | None = None
+    target_group:   UUID | None = None
+
+
 class BaseGroup(BaseModel):
     """
     The base model for session groups
@@ -46,14 +58,43 @@ class SessionGroup(BaseGroup):
     @classmethod
     def new_instance(
             cls,
-            name: str) -> typing.Self:
+            name: str,
+            group_uuid: UUID | None = None) -> typing.Self:
 
         inst = cls()
-        inst._group_uuid = request_uuid()
+        inst._group_uuid = group_uuid or request_uuid()
         inst._group_name = name
 
         inst._characters   = CreaturesMemoryBroker(CharacterV2)
         return inst
+
+    @classmethod
+    def from_mapping(cls, mapping: dict[str, typing.Any]) -> typing.Self:
+        """
+        Rebuild a group from the output of
+        `into_mapping`.
+        """
+
+        inst = cls.new_instance(mapping["name"], request_uuid(mapping["uuid"]))
+        for data in mapping["characters"]:
+            character = CharacterV2.model_validate(data)
+            inst._characters._resource_put(character.creature_uuid, character) #type: ignore
+        return inst
+
+    def into_mapping(self) -> dict[str, typing.Any]:
+        """
+        Transform this group into a JSON
+        serializable mapping.
+        """
+
+        return {
+            "uuid": str(self.group_uuid),
+            "name": self._group_name,
+            "characters": [
+                c.model_dump(mode="json", exclude_defaults=True)
+                for c in self._characters #type: ignore
+            ]
+        }
     
     @property
     def characters(self) -> Broker[UUID, Creature]:
@@ -84,5 +125,5 @@ class SessionGroupMemoryBroker(MemoryBroker[UUID, SessionGroup]):
             name)
         
         group_uuid = group.group_uuid
-        self.resource_map[group_uuid] = group
+        self._resource_put(group_uuid, group)
         return (group_uuid, group)
\ No newline at end of file
@@ -22,6 +22,9 @@ except ImportError:
         def close(self) -> None:
             pass
 
+        def sync(self) -> None:
+            pass
+
 
     def open(
             filename: str,
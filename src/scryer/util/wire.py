@@ -0,0 +1,120 @@
+"""
+Wire formats client connections can negotiate for
+events. `JSON` is always available. Binary formats
+are available when their packages are installed.
+"""
+
+import enum, functools, json, typing
+
+try:
+    # Optional. Only needed by clients asking for
+    # MessagePack.
+    import msgpack #type: ignore
+    MSGPACK_IMPLEMENTED = True
+except ImportError:
+    MSGPACK_IMPLEMENTED = False
+
+try:
+    # Optional. Only needed by clients asking for
+    # CBOR.
+    import cbor2 #type: ignore
+    CBOR_IMPLEMENTED = True
+except ImportError:
+    CBOR_IMPLEMENTED = False
+
+__all__ = (
+    "WireFormat",
+    "wire_decoder",
+    "wire_encoder",
+    "wire_format_of",
+    "wire_formats",
+    "wire_negotiate"
+)
+
+type WireData = str | bytes
+type WireEncoder = typing.Callable[[typing.Any], WireData]
+type WireDecoder = typing.Callable[[WireData], typing.Any]
+
+
+class WireFormat(enum.StrEnum):
+    """Encodings an event can be sent in."""
+
+    CBOR    = enum.auto()
+    JSON    = enum.auto()
+    MSGPACK = enum.auto()
+
+
+def _cbor_loads(data: WireData) -> typing.Any:
+    if isinstance(data, str):
+        data = data.encode()
+    try:
+        return cbor2.loads(data)
+    except cbor2.CBORDecodeError as e:
+        # Raised as `ValueError`, as every other
+        # decoder does.
+        raise ValueError(str(e)) from e
+
+
+def _json_dumps(data: typing.Any) -> str:
+    return json.dumps(data, default=str, ensure_ascii=False, separators=(",", ":"))
+
+
+@functools.cache
+def wire_decoder(fmt: WireFormat) -> WireDecoder:
+    """
+    Decoder of a wire format. Malformed data
+    raises `ValueError`.
+    """
+
+    if fmt is WireFormat.MSGPACK:
+        return functools.partial(msgpack.unpackb, raw=False)
+    if fmt is WireFormat.CBOR:
+        return _cbor_loads
+    return json.loads
+
+
+@functools.cache
+def wire_encoder(fmt: WireFormat) -> WireEncoder:
+    """
+    Encoder of a wire format. `JSON` encodes to
+    text, other formats to bytes. Values must be
+    `JSON` compatible.
+    """
+
+    if fmt is WireFormat.MSGPACK:
+        return msgpack.Packer(default=str).pack
+    if fmt is WireFormat.CBOR:
+        return cbor2.dumps
+    return _json_dumps
+
+
+def wire_format_of(sock: typing.Any) -> WireFormat:
+    """The wire format a connection negotiated."""
+
+    return getattr(sock.state, "wire_format", WireFormat.JSON)
+
+
+@functools.cache
+def wire_formats() -> tuple[WireFormat, ...]:
+    """Wire formats available to clients."""
+
+    available = [WireFormat.JSON]
+    if MSGPACK_IMPLEMENTED:
+        available.append(WireFormat.MSGPACK)
+    if CBOR_IMPLEMENTED:
+        available.append(WireFormat.CBOR)
+    return tuple(available)
+
+
+def wire_negotiate(requested: typing.Iterable[str] | None) -> WireFormat:
+    """
+    Pick the first available format a client asked
+    for, in order of its preference. Falls back to
+    `JSON`.
+    """
+
+    available = wire_formats()
+    for name in requested or ():
+        if name in available:
+            return WireFormat(name)
+    return WireFormat.JSON